@@ -0,0 +1,19 @@
+from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
+
+from benchmarks_base import BenchmarkBase
+from examples_base import User
+
+
+class BulkInsert(BenchmarkBase):
+    iterations = 10
+
+    def set_up(self, size: int) -> None:
+        self.size = size
+
+    def bench_bulk_insert(self, iteration: int) -> int:
+        with self.store.bulk_insert() as bulk_insert:
+            for number in range(self.size):
+                key = f"users/{iteration}-{number}"
+                # A new metadata for every user, store_as() fills in its shared default otherwise
+                bulk_insert.store_as(User(key, f"User {number}", 18 + number % 60), key, MetadataAsDictionary())
+        return self.size
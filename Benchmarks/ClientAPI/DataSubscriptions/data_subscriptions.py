@@ -0,0 +1,39 @@
+import threading
+
+from ravendb.documents.subscriptions.worker import SubscriptionBatch
+
+from benchmarks_base import BenchmarkBase, insert_users
+from examples_base import User
+
+
+class DataSubscriptions(BenchmarkBase):
+    iterations = 5
+    warmup = 1
+    timeout = 300
+
+    def set_up(self, size: int) -> None:
+        self.size = size
+        insert_users(self.store, size)
+
+    def bench_subscription_throughput(self, iteration: int) -> int:
+        # A new subscription every time, so each one processes all the documents from the start
+        subscription_name = self.store.subscriptions.create_for_class(User)
+        worker = self.store.subscriptions.get_subscription_worker_by_name(subscription_name, User)
+        processed = 0
+        done = threading.Event()
+
+        def _count(batch: SubscriptionBatch[User]):
+            nonlocal processed
+            processed += len(batch.items)
+            if processed >= self.size:
+                done.set()
+
+        worker.run(_count)
+        try:
+            if not done.wait(self.timeout):
+                raise TimeoutError(f"Subscription processed {processed} of {self.size} documents")
+        finally:
+            # Closed here rather than by store.close(), which closes still-running workers
+            worker.close()
+            self.store.subscriptions.delete(subscription_name)
+        return processed
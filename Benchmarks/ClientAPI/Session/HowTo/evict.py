@@ -0,0 +1,33 @@
+from bounded_session import open_bounded_session
+from benchmarks_base import BenchmarkBase, insert_users
+from examples_base import User
+
+PAGE_SIZE = 1_000
+
+
+class WalkingDocuments(BenchmarkBase):
+    """Loads all 'size' documents in pages, in one session, and edits every one of them."""
+
+    sizes = [10_000, 50_000]
+    iterations = 3
+    warmup = 1
+
+    def set_up(self, size: int) -> None:
+        self.keys = insert_users(self.store, size)
+        # A load and a save_changes() per page
+        self.store.conventions.max_number_of_requests_per_session = len(self.keys)
+
+    def _walk(self, session) -> int:
+        for start in range(0, len(self.keys), PAGE_SIZE):
+            for user in session.load(self.keys[start : start + PAGE_SIZE], User).values():
+                user.age += 1
+            session.save_changes()
+        return len(self.keys)
+
+    def bench_walk_one_session(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            return self._walk(session)
+
+    def bench_walk_bounded_session(self, iteration: int) -> int:
+        with open_bounded_session(self.store, max_entities=PAGE_SIZE) as session:
+            return self._walk(session)
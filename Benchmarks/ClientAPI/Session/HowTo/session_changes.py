@@ -0,0 +1,114 @@
+from ravendb import DocumentStore
+from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
+
+from benchmarks_base import BenchmarkBase, insert_users
+from dirty_tracking import DirtyTracked, enable_dirty_tracking
+from examples_base import Employee, User
+from incremental_changes import enable_incremental_changes
+
+
+class TrackedUser(DirtyTracked, User):
+    pass
+
+
+class TrackedEmployee(DirtyTracked, Employee):
+    # Keeps the slotted layout of the example entity
+    __slots__ = ()
+
+
+class SessionChanges(BenchmarkBase):
+    """save_changes() after editing one of 'size' entities tracked by the session."""
+
+    sizes = [1_000, 10_000, 50_000]
+    iterations = 20
+    dirty_tracking = False
+    incremental_changes = False
+
+    def set_up(self, size: int) -> None:
+        # Stored as the plain entity, loaded as the tracked one
+        keys = insert_users(self.store, size)
+
+        # A store of our own, conventions can't be changed after initialize()
+        self.tracking_store = DocumentStore(self.store.urls, self.store.database)
+        self.tracking_store.conventions.max_number_of_requests_per_session = 1_000
+        if self.dirty_tracking:
+            enable_dirty_tracking(self.tracking_store)
+        if self.incremental_changes:
+            enable_incremental_changes(self.tracking_store)
+        self.tracking_store.initialize()
+
+        self.session = self.tracking_store.open_session()
+        self.users = list(self.session.load(keys, TrackedUser).values())
+
+    def tear_down(self, size: int) -> None:
+        self.session.close()
+        self.tracking_store.close()
+
+    def bench_save_one_change(self, iteration: int) -> None:
+        self.users[iteration % len(self.users)].age += 1
+        self.session.save_changes()
+
+    def bench_what_changed_and_save(self, iteration: int) -> None:
+        # Like an audit hook looking at the changes before every save
+        self.users[iteration % len(self.users)].age += 1
+        self.session.advanced.what_changed()
+        self.session.save_changes()
+
+
+class DirtyTrackingSessionChanges(SessionChanges):
+    dirty_tracking = True
+
+
+class IncrementalSessionChanges(DirtyTrackingSessionChanges):
+    incremental_changes = True
+
+
+class EmployeeChanges(BenchmarkBase):
+    """save_changes() after editing one of 'size' slotted example entities tracked by the session."""
+
+    sizes = [1_000, 10_000]
+    iterations = 20
+    dirty_tracking = False
+    incremental_changes = False
+
+    def set_up(self, size: int) -> None:
+        keys = [f"employees/{number}-A" for number in range(1, size + 1)]
+        with self.store.bulk_insert() as bulk_insert:
+            for number, key in enumerate(keys):
+                employee = Employee(first_name=f"Employee {number}", last_name="Davolio")
+                # store_as() fills in its shared default metadata, which would turn the next users into employees
+                bulk_insert.store_as(employee, key, MetadataAsDictionary())
+
+        self.tracking_store = DocumentStore(self.store.urls, self.store.database)
+        self.tracking_store.conventions.max_number_of_requests_per_session = 1_000
+        if self.dirty_tracking:
+            enable_dirty_tracking(self.tracking_store)
+        if self.incremental_changes:
+            enable_incremental_changes(self.tracking_store)
+        self.tracking_store.initialize()
+
+        self.session = self.tracking_store.open_session()
+        self.employees = list(self.session.load(keys, TrackedEmployee).values())
+
+    def tear_down(self, size: int) -> None:
+        self.session.close()
+        self.tracking_store.close()
+
+    def bench_save_one_change(self, iteration: int) -> None:
+        employee = self.employees[iteration % len(self.employees)]
+        employee.notes = [f"Edit {iteration}"]
+        self.session.save_changes()
+
+    def bench_what_changed_and_save(self, iteration: int) -> None:
+        employee = self.employees[iteration % len(self.employees)]
+        employee.notes = [f"Edit {iteration}"]
+        self.session.advanced.what_changed()
+        self.session.save_changes()
+
+
+class DirtyTrackingEmployeeChanges(EmployeeChanges):
+    dirty_tracking = True
+
+
+class IncrementalEmployeeChanges(DirtyTrackingEmployeeChanges):
+    incremental_changes = True
@@ -0,0 +1,101 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from ravendb import SessionOptions
+
+from aggressive_cache import aggressively_cache
+from async_store import AsyncDocumentStore
+from benchmarks_base import BenchmarkBase, insert_users
+from document_cache import DocumentCache
+from document_loader import DocumentLoader
+from examples_base import User
+from read_only import load_read_only
+from request_ledger import RequestLedger
+
+# Documents most requests load, e.g. the current user
+HOT_DOCUMENTS = 20
+# Request handlers running at the same time, each loading one document in a session of its own
+CONCURRENT_HANDLERS = 16
+
+
+class LoadingEntities(BenchmarkBase):
+    iterations = 200
+
+    def set_up(self, size: int) -> None:
+        self.keys = insert_users(self.store, size)
+        self.cache = DocumentCache(self.store)
+        self.loader = DocumentLoader(self.store)
+        self.handlers = ThreadPoolExecutor(CONCURRENT_HANDLERS)
+        self.async_store = AsyncDocumentStore(self.store, CONCURRENT_HANDLERS)
+        self.loop = asyncio.new_event_loop()
+
+    def tear_down(self, size: int) -> None:
+        self.cache.close()
+        self.handlers.shutdown()
+        self.async_store.close()
+        self.loop.close()
+
+    def _run_handlers(self, iteration: int, handler) -> int:
+        first = iteration * CONCURRENT_HANDLERS
+        keys = [self.keys[(first + number) % len(self.keys)] for number in range(CONCURRENT_HANDLERS)]
+        list(self.handlers.map(handler, keys))
+        return CONCURRENT_HANDLERS
+
+    def _load(self, key: str) -> None:
+        with self.store.open_session() as session:
+            session.load(key, User)
+
+    def _load_coalesced(self, key: str) -> None:
+        with self.store.open_session() as session:
+            self.loader.load(session, key, User)
+
+    def bench_load(self, iteration: int) -> None:
+        with self.store.open_session() as session:
+            session.load(self.keys[iteration % len(self.keys)], User)
+
+    def bench_load_with_ledger(self, iteration: int) -> None:
+        with self.store.open_session() as session:
+            RequestLedger(session)
+            session.load(self.keys[iteration % len(self.keys)], User)
+
+    def bench_load_cached(self, iteration: int) -> None:
+        with self.store.open_session() as session:
+            self.cache.load(session, self.keys[iteration % HOT_DOCUMENTS], User)
+
+    def bench_load_aggressively_cached(self, iteration: int) -> None:
+        with aggressively_cache(self.store), self.store.open_session() as session:
+            session.load(self.keys[iteration % HOT_DOCUMENTS], User)
+
+    def bench_load_concurrent(self, iteration: int) -> int:
+        return self._run_handlers(iteration, self._load)
+
+    def bench_load_concurrent_coalesced(self, iteration: int) -> int:
+        return self._run_handlers(iteration, self._load_coalesced)
+
+    def bench_load_concurrent_async(self, iteration: int) -> int:
+        async def handler(key: str) -> None:
+            async with self.async_store.open_session() as session:
+                await session.load(key, User)
+
+        async def handle_all() -> None:
+            first = iteration * CONCURRENT_HANDLERS
+            keys = [self.keys[(first + number) % len(self.keys)] for number in range(CONCURRENT_HANDLERS)]
+            await asyncio.gather(*(handler(key) for key in keys))
+
+        self.loop.run_until_complete(handle_all())
+        return CONCURRENT_HANDLERS
+
+    def bench_load_many(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            session.load(self.keys, User)
+        return len(self.keys)
+
+    def bench_load_many_no_tracking(self, iteration: int) -> int:
+        with self.store.open_session(session_options=SessionOptions(no_tracking=True)) as session:
+            session.load(self.keys, User)
+        return len(self.keys)
+
+    def bench_load_many_read_only(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            load_read_only(session, self.keys, User)
+        return len(self.keys)
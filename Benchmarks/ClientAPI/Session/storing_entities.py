@@ -0,0 +1,25 @@
+from auto_flush import AutoFlushingSession
+from benchmarks_base import BenchmarkBase
+from examples_base import User
+
+
+class StoringEntities(BenchmarkBase):
+    sizes = [1_000, 10_000, 50_000]
+    iterations = 5
+
+    def set_up(self, size: int) -> None:
+        self.size = size
+
+    def bench_store_one_session(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            for number in range(self.size):
+                session.store(User(name=f"User {number}", age=18 + number % 60), f"users/{iteration}-{number}")
+            session.save_changes()
+        return self.size
+
+    def bench_store_auto_flush(self, iteration: int) -> int:
+        with AutoFlushingSession(self.store, max_operations=1_000) as session:
+            for number in range(self.size):
+                session.store(User(name=f"User {number}", age=18 + number % 60), f"users/{iteration}-{number}")
+            session.save_changes()
+        return self.size
@@ -0,0 +1,26 @@
+from datetime import datetime, timedelta
+
+from benchmarks_base import BenchmarkBase
+from examples_base import User
+
+START = datetime(2024, 1, 1)
+
+
+class TimeSeries(BenchmarkBase):
+    iterations = 20
+
+    def set_up(self, size: int) -> None:
+        self.size = size
+        with self.store.open_session() as session:
+            session.store(User(name="John"), "users/john")
+            session.save_changes()
+
+    def bench_append(self, iteration: int) -> int:
+        # Every iteration appends its own range of timestamps, so nothing is overwritten
+        first = START + timedelta(minutes=iteration * self.size)
+        with self.store.open_session() as session:
+            heart_rate = session.time_series_for("users/john", "HeartRates")
+            for minute in range(self.size):
+                heart_rate.append_single(first + timedelta(minutes=minute), 60 + minute % 40, "watches/fitbit")
+            session.save_changes()
+        return self.size
@@ -0,0 +1,57 @@
+from benchmarks_base import BenchmarkBase, insert_users
+from examples_base import User
+from query_templates import QueryTemplate
+
+USERS_NAMED_OR_AGED = QueryTemplate(
+    lambda session, p: session.query(object_type=User)
+    .where_equals("Name", p.name)
+    .or_else()
+    .where_in("Age", p.ages)
+    .order_by("Age")
+)
+
+
+class Filtering(BenchmarkBase):
+    def set_up(self, size: int) -> None:
+        insert_users(self.store, size)
+        with self.store.open_session() as session:
+            # Creates the auto index, only time queries against it once it's non-stale
+            USERS_NAMED_OR_AGED.run(session, name="", ages=[])
+            list(session.query(object_type=User).where_exists("Name").wait_for_non_stale_results().take(0))
+
+    def bench_build_query(self, iteration: int) -> int:
+        # Only builds the query, like every run does before sending it
+        with self.store.open_session() as session:
+            for number in range(100):
+                query = (
+                    session.query(object_type=User)
+                    .where_equals("Name", f"User {number}")
+                    .or_else()
+                    .where_in("Age", [18 + number % 60, 19 + number % 60])
+                    .order_by("Age")
+                )
+                query.index_query
+        return 100
+
+    def bench_bind_template(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            for number in range(100):
+                ages = [18 + number % 60, 19 + number % 60]
+                USERS_NAMED_OR_AGED.index_query(session, name=f"User {number}", ages=ages)
+        return 100
+
+    def bench_where_equals(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            users = list(
+                session.query(object_type=User)
+                .where_equals("Name", f"User {iteration}")
+                .or_else()
+                .where_in("Age", [18 + iteration % 60])
+                .order_by("Age")
+            )
+        return len(users)
+
+    def bench_where_equals_template(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            users = USERS_NAMED_OR_AGED.run(session, name=f"User {iteration}", ages=[18 + iteration % 60])
+        return len(users)
@@ -0,0 +1,60 @@
+from ravendb.documents.session.misc import OrderingType
+
+from Benchmarks.Indexes.Querying.query_index import Users_ByAge
+from benchmarks_base import BenchmarkBase, insert_users
+from examples_base import User
+from keyset_paging import keyset_pages
+from prefetch_paging import prefetch_pages
+from query_stream import stream
+
+PAGE_SIZE = 1_000
+
+
+class Paging(BenchmarkBase):
+    """Reads every result of a query over all 'size' users."""
+
+    sizes = [10_000, 100_000]
+    iterations = 5
+    warmup = 1
+
+    def set_up(self, size: int) -> None:
+        insert_users(self.store, size)
+        # A query per page
+        self.store.conventions.max_number_of_requests_per_session = 1_000
+        Users_ByAge().execute(self.store)
+        with self.store.open_session() as session:
+            list(session.query_index_type(Users_ByAge, User).wait_for_non_stale_results().take(0))
+
+    def bench_skip_take(self, iteration: int) -> int:
+        results = 0
+        with self.store.open_session() as session:
+            page_number = 0
+            while True:
+                page = list(
+                    session.query_index_type(Users_ByAge, User)
+                    .order_by("Age")
+                    .no_tracking()
+                    .skip(page_number * PAGE_SIZE)
+                    .take(PAGE_SIZE)
+                )
+                page_number += 1
+                if not page:
+                    return results
+                results += len(page)
+
+    def bench_keyset(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            pages = keyset_pages(
+                session, Users_ByAge, User, "Age", OrderingType.LONG, PAGE_SIZE, where=lambda query: query.no_tracking()
+            )
+            return sum(len(page.results) for page in pages)
+
+    def bench_skip_take_prefetched(self, iteration: int) -> int:
+        def users_by_age(session):
+            return session.query_index_type(Users_ByAge, User).order_by("Age").no_tracking()
+
+        return sum(len(page) for page in prefetch_pages(self.store, users_by_age, PAGE_SIZE, window=4))
+
+    def bench_stream(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            return sum(1 for _ in stream(session.query_index_type(Users_ByAge, User).order_by("Age")))
@@ -0,0 +1,54 @@
+from ravendb import AbstractIndexCreationTask
+
+from aggressive_cache import aggressively_cache
+from benchmarks_base import BenchmarkBase, insert_users
+from examples_base import User
+from query_cache import QueryCache
+from read_only import query_read_only
+
+
+class Users_ByAge(AbstractIndexCreationTask):
+    def __init__(self):
+        super().__init__()
+        self.map = "from user in docs.Users select new { user.Age }"
+
+
+class QueryIndex(BenchmarkBase):
+    def set_up(self, size: int) -> None:
+        insert_users(self.store, size)
+        Users_ByAge().execute(self.store)
+        with self.store.open_session() as session:
+            # Only time queries against a non-stale index
+            list(session.query_index_type(Users_ByAge, User).wait_for_non_stale_results().take(0))
+        self.query_cache = QueryCache(self.store)
+
+    def tear_down(self, size: int) -> None:
+        self.query_cache.close()
+
+    def bench_query_index_type(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            users = list(session.query_index_type(Users_ByAge, User).where_equals("Age", 18 + iteration % 60))
+        return len(users)
+
+    def bench_query_no_tracking(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            query = session.query_index_type(Users_ByAge, User).where_equals("Age", 18 + iteration % 60)
+            users = list(query.no_tracking())
+        return len(users)
+
+    def bench_query_read_only(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            users = query_read_only(session.query_index_type(Users_ByAge, User).where_equals("Age", 18 + iteration % 60))
+        return len(users)
+
+    def bench_query_aggressively_cached(self, iteration: int) -> int:
+        # The same few queries over and over, like a dashboard
+        with aggressively_cache(self.store), self.store.open_session() as session:
+            users = list(session.query_index_type(Users_ByAge, User).where_equals("Age", 18 + iteration % 5))
+        return len(users)
+
+    def bench_query_cached(self, iteration: int) -> int:
+        with self.store.open_session() as session:
+            query = session.query_index_type(Users_ByAge, User).where_equals("Age", 18 + iteration % 5)
+            users = self.query_cache.query(query)
+        return len(users)
@@ -132,7 +132,8 @@ class SubscriptionExamples(ExampleBase):
 
     def tearDown(self):
         with self.embedded_server.get_document_store("Manager") as store:
-            parameters = DeleteDatabaseOperation.Parameters(["SubscriptionsExamples"], True)
+            database_name = self.embedded_server.get_database_name("SubscriptionsExamples")
+            parameters = DeleteDatabaseOperation.Parameters([database_name], True)
             store.maintenance.server.send(DeleteDatabaseOperation(parameters=parameters))
 
     def test_subscriptions(self):
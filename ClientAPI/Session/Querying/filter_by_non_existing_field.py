@@ -1,7 +1,6 @@
 from ravendb import AbstractIndexCreationTask
-from ravendb.infrastructure.orders import Order
 
-from examples_base import ExampleBase
+from examples_base import ExampleBase, Order
 
 
 # region the_index
@@ -29,9 +28,8 @@ class FilterByNonExistingField(ExampleBase):
     def setUp(self):
         super().setUp()
         with self.embedded_server.get_document_store("FilterByNonExistingField") as store:
-            with store.open_session() as session:
-                Orders_ByFreight().execute(store)
-                self.add_orders(session)
+            Orders_ByFreight().execute(store)
+            self.seed(store, "orders")
 
     def test_filter_by_non_existing_field(self):
         with self.embedded_server.get_document_store("FilterByNonExistingField") as store:
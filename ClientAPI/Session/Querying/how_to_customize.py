@@ -5,9 +5,8 @@ from typing import Callable, TypeVar
 
 from ravendb import IndexQuery, QueryResult, AbstractIndexCreationTask, ProjectionBehavior, QueryTimings, DocumentQuery
 from ravendb.documents.indexes.definitions import FieldStorage
-from ravendb.infrastructure.orders import Employee
 
-from examples_base import ExampleBase
+from examples_base import ExampleBase, Employee
 
 _T = TypeVar("_T")
 
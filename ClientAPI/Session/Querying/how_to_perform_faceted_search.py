@@ -16,9 +16,10 @@ from ravendb import (
 )
 from ravendb.documents.queries.facets.definitions import FacetSetup
 from ravendb.documents.queries.facets.misc import FacetOptions, FacetTermSortMode, FacetAggregation
+from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 from ravendb.primitives import constants
 
-from cameras_helper import get_cameras, Camera
+from cameras_helper import generate_camera_columns, Camera
 from examples_base import ExampleBase
 
 _T = TypeVar("_T")
@@ -29,8 +30,8 @@ class HowToPerformFacetedSearch(ExampleBase):
         super().setUp()
         with self.embedded_server.get_document_store("FacetedSearch") as store:
             with store.bulk_insert() as bulk_insert:
-                for camera in get_cameras(100):
-                    bulk_insert.store(camera)
+                for key, camera in generate_camera_columns(100, seed=0).documents():
+                    bulk_insert.store_as(camera, key, MetadataAsDictionary())
 
             index_definition = IndexDefinition()
             index_definition.name = "Camera/Costs"
@@ -12,13 +12,8 @@ class HowToPerformQueriesLazily(ExampleBase):
     def setUp(self):
         super().setUp()
         with self.embedded_server.get_document_store("QueriesLazily") as store:
-            with store.open_session() as session:
-                self.add_employees(session)
-                self.add_companies(session)
-                self.add_products(session)
-                self.add_orders(session)
-                self.add_categories(session)
-                Products_ByCategoryAndPrice().execute(store)
+            self.seed(store, "employees", "companies", "products", "orders", "categories")
+            Products_ByCategoryAndPrice().execute(store)
 
     def test_how_to_perform_queries_lazily(self):
         with self.embedded_server.get_document_store("QueriesLazily") as store:
@@ -11,10 +11,7 @@ class HowToProjectQueryResults(ExampleBase):
     def setUp(self):
         super().setUp()
         with self.embedded_server.get_document_store("ProjectQueryResults") as store:
-            with store.open_session() as session:
-                self.add_orders(session)
-                self.add_companies(session)
-                self.add_employees(session)
+            self.seed(store, "orders", "companies", "employees")
 
     def test_examples(self):
         with self.embedded_server.get_document_store("ProjectQueryResults") as store:
@@ -13,9 +13,7 @@ class SortQueryResult(ExampleBase):
     def setUp(self):
         super().setUp()
         with self.embedded_server.get_document_store("SortQueryResults") as store:
-            with store.open_session() as session:
-                self.add_products(session)
-                self.add_employees(session)
+            self.seed(store, "products", "employees")
 
     def test_sort_query_results(self):
         with self.embedded_server.get_document_store("SortQueryResults") as store:
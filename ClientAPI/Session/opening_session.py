@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Optional
 
 from ravendb import (
@@ -16,11 +17,11 @@ from examples_base import ExampleBase
 
 
 class DocumentStoreFake(DocumentStoreReal):
-    def __init__(self):
-        super().__init__("http://127.0.0.1:8080", "OpeningSession")
+    def __init__(self, url: str, database: str):
+        super().__init__(url, database)
         self.initialize()
         try:
-            self.maintenance.server.send(CreateDatabaseOperation(DatabaseRecord("OpeningSession")))
+            self.maintenance.server.send(CreateDatabaseOperation(DatabaseRecord(database)))
         except RuntimeError as e:
             if "ConcurrencyException" in e.args[0]:
                 pass
@@ -31,8 +32,8 @@ class DocumentStoreFake(DocumentStoreReal):
 
 
 class DocumentStoreFakeUninitialized(DocumentStoreReal):
-    def __init__(self):
-        super().__init__("http://127.0.0.1:8080", "OpeningSession")
+    def __init__(self, url: str, database: str):
+        super().__init__(url, database)
 
 
 class OpeningSession(ExampleBase):
@@ -72,8 +73,10 @@ class OpeningSession(ExampleBase):
         # endregion
 
     def test_sample(self):
+        url = self.embedded_server.get_server_uri()
+        database = self.embedded_server.get_database_name("OpeningSession")
         with self.embedded_server.get_document_store("your_database_here") as store1:
-            DocumentStore = DocumentStoreFake
+            DocumentStore = partial(DocumentStoreFake, url, database)
             # region open_session_2
             with DocumentStore() as store:
                 store.open_session()
@@ -125,7 +128,7 @@ class OpeningSession(ExampleBase):
                     # code here
                     # endregion
                     ...
-            DocumentStore = DocumentStoreFakeUninitialized
+            DocumentStore = partial(DocumentStoreFakeUninitialized, url, database)
             # region ignore_entity_function
             with DocumentStore() as store:
                 # Create new DocumentConventions object
@@ -1,4 +1,5 @@
 from datetime import timedelta
+from functools import partial
 from typing import Optional
 
 from ravendb import InMemoryDocumentSessionOperations, SessionOptions, TransactionMode
@@ -62,8 +63,10 @@ class StoringEntities(ExampleBase):
                 session.save_changes()
                 # endregion
 
+            url = self.embedded_server.get_server_uri()
+            database = self.embedded_server.get_database_name("OpeningSession")
+            DocumentStore = partial(DocumentStoreFake, url, database)
             # region cluster_store_with_compare_exchange
-            DocumentStore = DocumentStoreFake
             with DocumentStore() as store:
                 with store.open_session(
                     session_options=SessionOptions(
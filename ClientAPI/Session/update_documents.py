@@ -12,9 +12,9 @@ class StoringEntities(ExampleBase):
     def get_document_store(self) -> DocumentStore:
         store = self.embedded_server.get_document_store("TestDatabase")
 
-        parameters = DeleteDatabaseOperation.Parameters(["TestDatabase"], True)
+        parameters = DeleteDatabaseOperation.Parameters([store.database], True)
         store.maintenance.server.send(DeleteDatabaseOperation(parameters=parameters))
-        store.maintenance.server.send(CreateDatabaseOperation(DatabaseRecord("TestDatabase")))
+        store.maintenance.server.send(CreateDatabaseOperation(DatabaseRecord(store.database)))
         return store
 
     def test_update_document_sync(self):
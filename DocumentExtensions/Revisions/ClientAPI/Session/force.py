@@ -7,8 +7,7 @@ class Force(ExampleBase):
 
     def test_force_revision_creation_for(self):
         with self.embedded_server.get_document_store("ForceRevision") as store:
-            with store.open_session() as session:
-                self.add_companies(session)
+            self.seed(store, "companies")
             company_id = "companies/1"
             # region force_revision_creation_for
             with store.open_session() as session:
@@ -5,6 +5,7 @@ from ravendb import AbstractIndexCreationTask, QueryData, DocumentQuery, Project
 from ravendb.documents.indexes.definitions import FieldStorage
 from ravendb.documents.session.tokens.query_tokens.definitions import DeclareToken, LoadToken
 
+from entity_schema import DateTimeField, Field, SlotsEntity, json_schema
 from examples_base import ExampleBase, Employee, Order, Company
 
 _TProjection = TypeVar("_TProjection")
@@ -90,7 +91,8 @@ class Orders_ByShippedAtAndCompany(AbstractIndexCreationTask):
 class ShipToAndProducts: ...
 
 
-class OrderProjection: ...
+@json_schema(Field("company_name", optional=True), DateTimeField("shipped_at", optional=True), slots=True)
+class OrderProjection(SlotsEntity): ...
 
 
 class Total: ...
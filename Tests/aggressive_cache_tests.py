@@ -0,0 +1,82 @@
+import datetime
+import time
+
+from ravendb import DocumentStore
+from ravendb.http.misc import AggressiveCacheMode
+
+from aggressive_cache import aggressively_cache, aggressively_cache_for
+from examples_base import ExampleBase, User
+
+
+class AggressiveCacheInvalidation(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("AggressiveCacheInvalidation")
+        with self.store.open_session() as session:
+            session.store(User(name="John", age=30), "users/1")
+            session.save_changes()
+
+        # Another client of the same database, its writes only reach the cache through the server
+        self.other_store = DocumentStore(self.store.urls, self.store.database)
+        self.other_store.initialize()
+
+    def tearDown(self):
+        self.other_store.close()
+        self.store.close()
+
+    def _load(self):
+        with self.store.open_session() as session:
+            return session.load("users/1", User)
+
+    def _requests(self) -> int:
+        return self.store.get_request_executor().number_of_server_requests
+
+    def _load_until(self, condition):
+        # Notifications arrive a few milliseconds after the change, until then the cached response is used
+        deadline = time.monotonic() + 10
+        user = self._load()
+        while not condition(user) and time.monotonic() < deadline:
+            time.sleep(0.01)
+            user = self._load()
+        return user
+
+    def _write_from_other_store(self, age: int):
+        with self.other_store.open_session() as session:
+            session.load("users/1", User).age = age
+            session.save_changes()
+
+    def test_writes_of_other_stores_invalidate_through_changes(self):
+        with aggressively_cache(self.store):
+            self._load()
+            requests = self._requests()
+            self.assertEqual(30, self._load().age)
+            self.assertEqual(requests, self._requests())
+
+            self._write_from_other_store(31)
+            self.assertEqual(31, self._load_until(lambda user: user.age == 31).age)
+
+    def test_own_saves_and_deletes_invalidate_through_changes(self):
+        with aggressively_cache(self.store):
+            self._load()
+            with self.store.open_session() as session:
+                session.load("users/1", User).age = 31
+                session.save_changes()
+            self.assertEqual(31, self._load_until(lambda user: user.age == 31).age)
+
+            with self.store.open_session() as session:
+                session.delete("users/1")
+                session.save_changes()
+            self.assertIsNone(self._load_until(lambda user: user is None))
+
+    def test_without_tracking_changes_responses_are_used_until_they_expire(self):
+        duration = datetime.timedelta(seconds=1)
+        with aggressively_cache_for(self.store, duration, AggressiveCacheMode.DO_NOT_TRACK_CHANGES):
+            self._load()
+            self._write_from_other_store(31)
+            requests = self._requests()
+            self.assertEqual(30, self._load().age)
+            self.assertEqual(requests, self._requests())
+
+            time.sleep(duration.total_seconds())
+            self.assertEqual(31, self._load().age)
+            self.assertEqual(requests + 1, self._requests())
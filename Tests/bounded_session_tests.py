@@ -0,0 +1,78 @@
+from bounded_session import open_bounded_session
+from dirty_tracking import DirtyTracked
+from examples_base import Employee, ExampleBase, User
+
+USERS = 50
+MAX_ENTITIES = 10
+
+
+class TrackedEmployee(DirtyTracked, Employee):
+    __slots__ = ()
+
+
+class BoundedSession(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("BoundedSession")
+        with self.store.open_session() as session:
+            for i in range(USERS):
+                session.store(User(name=f"User {i}", age=i), f"users/{i}")
+            session.store(Employee(first_name="Jane", last_name="Doe", notes=["English"]), "employees/1")
+            session.save_changes()
+
+    def tearDown(self):
+        self.store.close()
+
+    def _query_users(self, session):
+        return list(session.query(object_type=User).wait_for_non_stale_results())
+
+    def test_results_of_an_over_limit_query_are_kept_and_saved(self):
+        with open_bounded_session(self.store, max_entities=MAX_ENTITIES) as session:
+            users = self._query_users(session)
+            self.assertEqual(USERS, len(users))
+            self.assertEqual(0, session.bounded_tracking.evictions)
+            for user in users:
+                user.age += 100
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            users = session.load([f"users/{i}" for i in range(USERS)], User)
+            self.assertEqual(list(range(100, 100 + USERS)), [users[f"users/{i}"].age for i in range(USERS)])
+
+    def test_only_clean_entities_are_evicted_by_the_next_request(self):
+        with open_bounded_session(self.store, max_entities=MAX_ENTITIES) as session:
+            users = self._query_users(session)
+            # The least recently used, it would be evicted first
+            users[0].age = -1
+            session.store(User(name="New"), "users/new")
+
+            session.load("users/missing", User)
+            # The modified one leaves the LRU list without being evicted, the last MAX_ENTITIES stay in it
+            self.assertEqual(USERS - MAX_ENTITIES - 1, session.bounded_tracking.evictions)
+            self.assertEqual(MAX_ENTITIES, len(session.bounded_tracking))
+            self.assertTrue(session.advanced.is_loaded(users[0].Id))
+            self.assertTrue(session.advanced.is_loaded("users/new"))
+            self.assertFalse(session.advanced.is_loaded(users[1].Id))
+            self.assertTrue(session.advanced.is_loaded(users[-1].Id))
+            # Nothing evicted was modified
+            for user in users[1 : USERS - MAX_ENTITIES]:
+                self.assertEqual(int(user.name.split()[1]), user.age)
+
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(-1, session.load(users[0].Id, User).age)
+            self.assertEqual("New", session.load("users/new", User).name)
+
+    def test_in_place_changes_of_dirty_tracked_entities_are_kept(self):
+        with open_bounded_session(self.store, max_entities=MAX_ENTITIES) as session:
+            employee = session.load("employees/1", TrackedEmployee)
+            # Not marked dirty, but save_changes() of a store without dirty tracking saves it
+            employee.notes.append("Italian")
+            self._query_users(session)
+            session.load("users/missing", User)
+            self.assertTrue(session.advanced.is_loaded("employees/1"))
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(["English", "Italian"], session.load("employees/1", Employee).notes)
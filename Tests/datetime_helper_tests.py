@@ -0,0 +1,62 @@
+import unittest
+from datetime import datetime
+from unittest import TestCase
+
+from ravendb.tools.utils import Utils
+
+from datetime_helper import parse_datetime, parse_datetime_column
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Formats the server writes, Utils.string_to_datetime parses them too
+RAVEN_TIMESTAMPS = [
+    "1996-07-04T00:00:00.0000000",
+    "2024-01-02T03:04:05.1234567",
+    "2024-01-02T03:04:05.1234567Z",
+    "2024-01-02T03:04:05.123456",
+    "2024-01-02T03:04:05.12Z",
+]
+
+# Only parsed by fromisoformat(), Utils.string_to_datetime raises ValueError
+OTHER_TIMESTAMPS = {
+    "2024-01-02T03:04:05": datetime(2024, 1, 2, 3, 4, 5),
+    "2024-01-02T03:04:05Z": datetime(2024, 1, 2, 3, 4, 5),
+    "2024-01-02": datetime(2024, 1, 2),
+    "2024-01-02T03:04:05+02:00": datetime(2024, 1, 2, 1, 4, 5),
+    "2024-01-02T03:04:05.1234567+02:00": datetime(2024, 1, 2, 1, 4, 5, 123456),
+    # As long as the server's format, the offset takes the place of fractional digits
+    "2024-01-02T03:04:05.1-02:00": datetime(2024, 1, 2, 5, 4, 5, 100000),
+}
+
+
+class ParseDatetime(TestCase):
+    def test_raven_timestamps_match_the_client(self):
+        for value in RAVEN_TIMESTAMPS:
+            with self.subTest(value=value):
+                self.assertEqual(Utils.string_to_datetime(value), parse_datetime(value))
+                self.assertIsNone(parse_datetime(value).tzinfo)
+
+    def test_other_timestamps_parse_to_naive_utc(self):
+        for value, expected in OTHER_TIMESTAMPS.items():
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    Utils.string_to_datetime(value)
+                self.assertEqual(expected, parse_datetime(value))
+                self.assertIsNone(parse_datetime(value).tzinfo)
+
+    def test_invalid_timestamps_raise(self):
+        with self.assertRaises(ValueError):
+            parse_datetime("not a timestamp")
+        self.assertIsNone(parse_datetime(None))
+
+
+@unittest.skipIf(np is None, "needs the numpy package")
+class ParseDatetimeColumn(TestCase):
+    def test_columns_match_parse_datetime(self):
+        values = RAVEN_TIMESTAMPS + list(OTHER_TIMESTAMPS) + [None]
+        column = parse_datetime_column(values)
+        self.assertEqual(np.dtype("datetime64[us]"), column.dtype)
+        self.assertEqual([parse_datetime(value) for value in values], column.tolist())
@@ -0,0 +1,97 @@
+from unittest import mock
+
+from ravendb import DocumentStore
+
+from dirty_tracking import DirtyTracked, enable_dirty_tracking, is_dirty, mark_dirty
+from examples_base import Employee, ExampleBase, User
+
+
+class TrackedUser(DirtyTracked, User): ...
+
+
+class TrackedEmployee(DirtyTracked, Employee):
+    __slots__ = ()
+
+
+class DirtyTracking(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("DirtyTracking")
+        with self.store.open_session() as session:
+            session.store(User(name="John", age=30), "users/1")
+            session.store(Employee(first_name="Jane", last_name="Doe", notes=["English"]), "employees/1")
+            session.save_changes()
+
+        self.tracking_store = DocumentStore(self.store.urls, self.store.database)
+        enable_dirty_tracking(self.tracking_store)
+        self.tracking_store.initialize()
+
+    def tearDown(self):
+        self.tracking_store.close()
+        self.store.close()
+
+    def test_assigned_fields_are_saved(self):
+        with self.tracking_store.open_session() as session:
+            user = session.load("users/1", TrackedUser)
+            self.assertFalse(is_dirty(user))
+            user.age = 31
+            self.assertTrue(is_dirty(user))
+            session.save_changes()
+            self.assertFalse(is_dirty(user))
+
+        with self.store.open_session() as session:
+            self.assertEqual(31, session.load("users/1", User).age)
+
+    def test_clean_entities_send_no_write(self):
+        with self.tracking_store.open_session() as session:
+            session.load("users/1", TrackedUser)
+            session.load("employees/1", TrackedEmployee)
+            requests = session.advanced.number_of_requests
+            with mock.patch.object(
+                session.entity_to_json, "convert_entity_to_json", wraps=session.entity_to_json.convert_entity_to_json
+            ) as convert_entity_to_json:
+                session.save_changes()
+            self.assertEqual(requests, session.advanced.number_of_requests)
+            # Skipped without being serialized
+            convert_entity_to_json.assert_not_called()
+
+    def test_in_place_changes_need_mark_dirty(self):
+        with self.tracking_store.open_session() as session:
+            employee = session.load("employees/1", TrackedEmployee)
+            employee.notes.append("Italian")
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(["English"], session.load("employees/1", Employee).notes)
+
+        with self.tracking_store.open_session() as session:
+            employee = session.load("employees/1", TrackedEmployee)
+            employee.notes.append("Italian")
+            mark_dirty(employee)
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(["English", "Italian"], session.load("employees/1", Employee).notes)
+
+    def test_new_and_deleted_entities_are_saved(self):
+        with self.tracking_store.open_session() as session:
+            session.store(TrackedUser(name="New", age=1), "users/2")
+            session.delete("users/1")
+            session.save_changes()
+
+        with self.tracking_store.open_session() as session:
+            self.assertEqual("New", session.load("users/2", TrackedUser).name)
+            self.assertIsNone(session.load("users/1", TrackedUser))
+
+    def test_enabling_after_initialize_fails(self):
+        # Conventions are frozen by initialize(), the store keeps comparing every entity
+        with self.assertRaises(RuntimeError):
+            enable_dirty_tracking(self.store)
+
+        with self.store.open_session() as session:
+            employee = session.load("employees/1", TrackedEmployee)
+            employee.notes.append("Italian")
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(["English", "Italian"], session.load("employees/1", Employee).notes)
@@ -0,0 +1,80 @@
+import time
+
+from ravendb import DocumentStore
+
+from document_cache import DocumentCache
+from examples_base import ExampleBase, User
+
+
+class DocumentCacheInvalidation(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("DocumentCacheInvalidation")
+        with self.store.open_session() as session:
+            session.store(User(name="John", age=30), "users/1")
+            session.save_changes()
+
+        # Another client of the same database, its writes only reach the cache through the server
+        self.other_store = DocumentStore(self.store.urls, self.store.database)
+        self.other_store.initialize()
+
+    def tearDown(self):
+        self.other_store.close()
+        self.store.close()
+
+    def _load(self, cache: DocumentCache, key: str = "users/1"):
+        with self.store.open_session() as session:
+            return cache.load(session, key, User)
+
+    def _write_from_other_store(self, age: int):
+        with self.other_store.open_session() as session:
+            session.load("users/1", User).age = age
+            session.save_changes()
+
+    def test_writes_of_other_stores_invalidate_through_changes(self):
+        with DocumentCache(self.store) as cache:
+            self._load(cache)
+            self.assertEqual(30, self._load(cache).age)
+            self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+            self._write_from_other_store(31)
+            deadline = time.monotonic() + 10
+            while len(cache) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(0, len(cache), "no change notification invalidated the document")
+            self.assertEqual(31, self._load(cache).age)
+
+    def test_own_saves_and_deletes_invalidate_right_away(self):
+        # Without the Changes API, only the session events can invalidate before the next load
+        with DocumentCache(self.store, use_changes=False) as cache:
+            self._load(cache)
+            with self.store.open_session() as session:
+                session.load("users/1", User).age = 31
+                session.save_changes()
+            self.assertEqual(0, len(cache))
+            self.assertEqual(31, self._load(cache).age)
+
+            with self.store.open_session() as session:
+                session.delete("users/1")
+                session.save_changes()
+            self.assertEqual(0, len(cache))
+            self.assertIsNone(self._load(cache))
+
+    def test_hits_are_revalidated_without_changes(self):
+        with DocumentCache(self.store, use_changes=False) as cache:
+            self._load(cache)
+            self.assertEqual(30, self._load(cache).age)
+            self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+            self._write_from_other_store(31)
+            self.assertEqual(31, self._load(cache).age)
+            self.assertEqual((1, 2), (cache.hits, cache.misses))
+            # Cached again, the modified version
+            self.assertEqual(31, self._load(cache).age)
+            self.assertEqual((2, 2), (cache.hits, cache.misses))
+
+            with self.other_store.open_session() as session:
+                session.delete("users/1")
+                session.save_changes()
+            self.assertIsNone(self._load(cache))
+            self.assertEqual(0, len(cache))
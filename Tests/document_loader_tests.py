@@ -0,0 +1,57 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from document_loader import DocumentLoader
+from examples_base import ExampleBase, User
+
+USERS = 8
+
+
+class DocumentLoaderCoalescing(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("DocumentLoaderCoalescing")
+        with self.store.open_session() as session:
+            for i in range(USERS):
+                session.store(User(name=f"User {i}", age=i), f"users/{i}")
+            session.save_changes()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_coalesced_loads_return_the_entity_of_each_caller(self):
+        keys = [f"users/{i}" for i in range(USERS)] + ["users/missing", "USERS/1"]
+        # Long enough for every caller to join the batch
+        loader = DocumentLoader(self.store, window=1)
+        barrier = threading.Barrier(len(keys))
+
+        def load(key):
+            with self.store.open_session() as session:
+                barrier.wait()
+                user = loader.load(session, key, User)
+                # Tracked by the session, or known to be missing, like with session.load()
+                requests = session.advanced.number_of_requests
+                self.assertIs(user, session.load(key, User))
+                self.assertEqual(requests, session.advanced.number_of_requests)
+                return user
+
+        with ThreadPoolExecutor(len(keys)) as executor:
+            users = list(executor.map(load, keys))
+
+        self.assertEqual(1, loader.requests)
+        for i in range(USERS):
+            self.assertEqual(f"users/{i}", users[i].Id)
+            self.assertEqual(f"User {i}", users[i].name)
+        self.assertIsNone(users[USERS])
+        # Same document as users/1, its own entity
+        self.assertEqual("User 1", users[USERS + 1].name)
+        self.assertIsNot(users[1], users[USERS + 1])
+
+    def test_loaded_entities_are_saved_like_any_other(self):
+        loader = DocumentLoader(self.store)
+        with self.store.open_session() as session:
+            loader.load(session, "users/1", User).age = 100
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(100, loader.load(session, "users/1", User).age)
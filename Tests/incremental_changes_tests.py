@@ -0,0 +1,86 @@
+from ravendb.documents.session.document_session import DocumentSession
+
+from dirty_tracking import DirtyTracked, mark_dirty
+from examples_base import Employee, ExampleBase, User
+from incremental_changes import IncrementalChanges
+
+
+class TrackedUser(DirtyTracked, User): ...
+
+
+class TrackedEmployee(DirtyTracked, Employee):
+    __slots__ = ()
+
+
+def _comparable(changes):
+    # Field changes are dicts, deletes DocumentsChanges
+    return {
+        key: [change if isinstance(change, dict) else vars(change) for change in document_changes]
+        for key, document_changes in changes.items()
+    }
+
+
+class IncrementalWhatChanged(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("IncrementalWhatChanged")
+        with self.store.open_session() as session:
+            for i in range(1, 4):
+                session.store(User(name=f"User {i}", age=i), f"users/{i}")
+            session.store(Employee(first_name="Jane", last_name="Doe", notes=["English"]), "employees/1")
+            session.store(Employee(first_name="John", last_name="Doe", notes=["English"]), "employees/2")
+            session.save_changes()
+
+    def tearDown(self):
+        self.store.close()
+
+    def assertSameChanges(self, session: DocumentSession):
+        incremental = session.advanced.what_changed()
+        # The client's own, comparing every entity
+        expected = DocumentSession._what_changed(session)
+        self.assertEqual(_comparable(expected), _comparable(incremental))
+        return incremental
+
+    def test_changes_match_the_clients(self):
+        with self.store.open_session() as session:
+            IncrementalChanges(session)
+            users = {key: session.load(key, TrackedUser) for key in ("users/1", "users/2", "users/3")}
+            employee = session.load("employees/1", TrackedEmployee)
+            plain_employee = session.load("employees/2", Employee)
+            self.assertEqual({}, self.assertSameChanges(session))
+
+            users["users/1"].age = 10
+            session.delete(users["users/3"])
+            session.store(TrackedUser(name="New", age=4), "users/4")
+            employee.notes.append("Italian")
+            mark_dirty(employee)
+            # Not DirtyTracked, compared on every call
+            plain_employee.notes.append("Italian")
+            self.assertEqual(
+                {"users/1", "users/3", "users/4", "employees/1", "employees/2"},
+                set(self.assertSameChanges(session)),
+            )
+
+            # Modified again after the previous call, and back to the loaded value
+            users["users/1"].age = 11
+            self.assertSameChanges(session)
+            users["users/1"].age = 1
+            self.assertSameChanges(session)
+
+            session.save_changes()
+            self.assertEqual({}, self.assertSameChanges(session))
+
+    def test_clean_entities_are_not_computed_again(self):
+        with self.store.open_session() as session:
+            changes = IncrementalChanges(session)
+            user = session.load("users/1", TrackedUser)
+            session.load("users/2", TrackedUser)
+            user.age = 10
+            self.assertEqual(["users/1"], list(session.advanced.what_changed()))
+            computed = changes.computed
+            self.assertEqual(["users/1"], list(session.advanced.what_changed()))
+            self.assertEqual(computed, changes.computed)
+
+            user.name = "Renamed"
+            self.assertEqual(2, len(changes.what_changed_for(user)))
+            self.assertEqual(computed + 1, changes.computed)
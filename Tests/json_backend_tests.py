@@ -0,0 +1,39 @@
+import unittest
+from unittest import mock
+
+from examples_base import ExampleBase, User
+from json_backend import OrjsonJson, install_json_backend, orjson, uninstall_json_backend
+
+
+@unittest.skipIf(orjson is None, "needs the orjson package")
+class OrjsonBackend(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("OrjsonBackend")
+        install_json_backend(OrjsonJson())
+
+    def tearDown(self):
+        uninstall_json_backend()
+        self.store.close()
+
+    def test_request_bodies_are_encoded_by_orjson(self):
+        with mock.patch.object(orjson, "dumps", wraps=orjson.dumps) as dumps:
+            with self.store.open_session() as session:
+                session.store(User(name="Zoë Żak", age=30), "users/1")
+                session.save_changes()
+            self.assertTrue(
+                any("users/1" in str(call.args[0]) for call in dumps.call_args_list),
+                "the save_changes() batch didn't go through orjson.dumps",
+            )
+
+        with self.store.open_session() as session:
+            self.assertEqual("Zoë Żak", session.load("users/1", User).name)
+
+    def test_only_what_orjson_cant_do_falls_back(self):
+        backend = OrjsonJson()
+        with mock.patch.object(orjson, "dumps", wraps=orjson.dumps) as dumps:
+            self.assertEqual('{"name":"Zoë"}', backend.dumps({"name": "Zoë"}, ensure_ascii=False))
+            self.assertEqual(1, dumps.call_count)
+            self.assertEqual('{"name": "Zo\\u00eb"}', backend.dumps({"name": "Zoë"}, ensure_ascii=True))
+            self.assertEqual('{\n "name": 1\n}', backend.dumps({"name": 1}, indent=1))
+            self.assertEqual(1, dumps.call_count)
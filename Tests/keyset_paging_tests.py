@@ -0,0 +1,63 @@
+from ravendb import AbstractIndexCreationTask
+from ravendb.documents.session.misc import OrderingType
+
+from examples_base import ExampleBase, User
+from keyset_paging import keyset_pages
+
+USERS = 25
+PAGE_SIZE = 4
+
+
+class Users_ByAge(AbstractIndexCreationTask):
+    def __init__(self):
+        super().__init__()
+        self.map = "from user in docs.Users select new { user.Age }"
+
+
+class KeysetPaging(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("KeysetPaging")
+        with self.store.open_session() as session:
+            for i in range(USERS):
+                # Ages shared by several users, ordered by their id within
+                session.store(User(name=f"User {i}", age=i % 4), f"users/{i}")
+            session.save_changes()
+        Users_ByAge().execute(self.store)
+        with self.store.open_session() as session:
+            list(session.query_index_type(Users_ByAge, User).wait_for_non_stale_results().take(0))
+
+    def tearDown(self):
+        self.store.close()
+
+    def _pages(self, **kwargs):
+        with self.store.open_session() as session:
+            return list(keyset_pages(session, Users_ByAge, User, "Age", OrderingType.LONG, PAGE_SIZE, **kwargs))
+
+    def _expected(self, ages=range(4)):
+        users = [(i % 4, f"users/{i}") for i in range(USERS) if i % 4 in ages]
+        return [key for _, key in sorted(users)]
+
+    def test_pages_have_no_gaps_or_duplicates(self):
+        pages = self._pages()
+        self.assertEqual(self._expected(), [user.Id for page in pages for user in page.results])
+        self.assertEqual([PAGE_SIZE] * (len(pages) - 1), [len(page.results) for page in pages[:-1]])
+        self.assertTrue(all(page.continuation_token for page in pages[:-1]))
+        self.assertIsNone(pages[-1].continuation_token)
+
+    def test_pages_resume_from_a_continuation_token(self):
+        pages = self._pages()
+        resumed = self._pages(continuation_token=pages[1].continuation_token)
+        self.assertEqual(
+            [[user.Id for user in page.results] for page in pages[2:]],
+            [[user.Id for user in page.results] for page in resumed],
+        )
+
+    def test_where_conditions_apply_to_every_page(self):
+        # An or_else() of its own doesn't bring back the results before the position
+        pages = self._pages(where=lambda query: query.where_equals("Age", 0).or_else().where_equals("Age", 3))
+        self.assertEqual(self._expected(ages=(0, 3)), [user.Id for page in pages for user in page.results])
+
+    def test_invalid_continuation_tokens_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self._pages(continuation_token="not a token")
@@ -0,0 +1,34 @@
+from ravendb import GetCollectionStatisticsOperation
+
+from examples_base import Company, ExampleBase, Order
+from northwind_helper import CATEGORIES, NorthwindGenerator
+
+
+class NorthwindGeneratorBulkInsert(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("NorthwindGeneratorBulkInsert")
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_documents_are_inserted_into_their_collections(self):
+        generator = NorthwindGenerator(scale=0.05, seed=1)
+        count = generator.bulk_insert(self.store)
+
+        stats = self.store.maintenance.send(GetCollectionStatisticsOperation())
+        self.assertEqual(
+            {
+                "Categories": len(CATEGORIES),
+                "Companies": generator.companies_count,
+                "Employees": generator.employees_count,
+                "Products": generator.products_count,
+                "Orders": generator.orders_count,
+            },
+            stats.collections,
+        )
+        self.assertEqual(count, stats.count_of_documents)
+
+        with self.store.open_session() as session:
+            self.assertEqual("companies/1-A", session.load("companies/1-A", Company).Id)
+            self.assertEqual("orders/1-A", session.load("orders/1-A", Order).Id)
@@ -0,0 +1,92 @@
+import datetime
+import time
+
+from ravendb import DocumentStore
+
+from examples_base import ExampleBase, User
+from query_cache import QueryCache
+
+
+class QueryCacheInvalidation(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("QueryCacheInvalidation")
+        with self.store.open_session() as session:
+            session.store(User(name="John", age=30), "users/1")
+            session.store(User(name="Jane", age=40), "users/2")
+            session.save_changes()
+        with self.store.open_session() as session:
+            # Creates the auto index up front, its notifications would invalidate the first cached results
+            list(session.query(object_type=User).where_greater_than("Age", 0).wait_for_non_stale_results())
+
+        # Another client of the same database, its writes only reach the cache through the server
+        self.other_store = DocumentStore(self.store.urls, self.store.database)
+        self.other_store.initialize()
+
+    def tearDown(self):
+        self.other_store.close()
+        self.store.close()
+
+    def _ages(self, cache: QueryCache):
+        with self.store.open_session() as session:
+            return sorted(user.age for user in cache.query(session.query(object_type=User)))
+
+    def _ages_by_index(self, cache: QueryCache):
+        with self.store.open_session() as session:
+            query = session.query(object_type=User).where_greater_than("Age", 0).wait_for_non_stale_results()
+            return sorted(user.age for user in cache.query(query))
+
+    def _query_until(self, query, expected):
+        # Notifications arrive a few milliseconds after the change, until then the cached results are used
+        deadline = time.monotonic() + 10
+        results = query()
+        while results != expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+            results = query()
+        return results
+
+    def _write_from_other_store(self, age: int):
+        with self.other_store.open_session() as session:
+            session.load("users/1", User).age = age
+            session.save_changes()
+
+    def test_writes_of_other_stores_invalidate_through_changes(self):
+        with QueryCache(self.store) as cache:
+            self._ages(cache)
+            self._ages_by_index(cache)
+            self.assertEqual([30, 40], self._ages(cache))
+            self.assertEqual([30, 40], self._ages_by_index(cache))
+            self.assertEqual((2, 2), (cache.hits, cache.misses))
+
+            self._write_from_other_store(31)
+            # Collection queries by the document change, index queries once the index processed it
+            self.assertEqual([31, 40], self._query_until(lambda: self._ages(cache), [31, 40]))
+            self.assertEqual([31, 40], self._query_until(lambda: self._ages_by_index(cache), [31, 40]))
+
+    def test_own_saves_and_deletes_invalidate_through_changes(self):
+        with QueryCache(self.store) as cache:
+            self._ages(cache)
+            self._ages_by_index(cache)
+            with self.store.open_session() as session:
+                session.load("users/1", User).age = 31
+                session.save_changes()
+            self.assertEqual([31, 40], self._query_until(lambda: self._ages(cache), [31, 40]))
+            self.assertEqual([31, 40], self._query_until(lambda: self._ages_by_index(cache), [31, 40]))
+
+            with self.store.open_session() as session:
+                session.delete("users/1")
+                session.save_changes()
+            self.assertEqual([40], self._query_until(lambda: self._ages(cache), [40]))
+            self.assertEqual([40], self._query_until(lambda: self._ages_by_index(cache), [40]))
+
+    def test_without_changes_results_are_used_until_they_expire(self):
+        ttl = datetime.timedelta(seconds=1)
+        with QueryCache(self.store, ttl=ttl, use_changes=False) as cache:
+            self._ages(cache)
+            self._write_from_other_store(31)
+            self.assertEqual([30, 40], self._ages(cache))
+            self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+            time.sleep(ttl.total_seconds())
+            self.assertEqual([31, 40], self._ages(cache))
+            self.assertEqual((1, 2), (cache.hits, cache.misses))
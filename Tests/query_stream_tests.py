@@ -0,0 +1,60 @@
+from unittest import mock
+
+import requests
+from ravendb.documents.session.stream_statistics import StreamQueryStatistics
+
+from examples_base import ExampleBase, User
+from query_stream import stream
+
+USERS = 20
+
+
+class UserName:
+    def __init__(self, name: str = None):
+        self.name = name
+
+
+class QueryStream(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("QueryStream")
+        with self.store.open_session() as session:
+            for i in range(USERS):
+                session.store(User(name=f"User {i}", age=i), f"users/{i}")
+            session.save_changes()
+        with self.store.open_session() as session:
+            list(session.query(object_type=User).where_greater_than("Age", 0).wait_for_non_stale_results())
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_streamed_entities_match_the_query(self):
+        with self.store.open_session() as session:
+            expected = [(user.Id, user.name, user.age) for user in session.query(object_type=User).order_by("Age")]
+
+        with self.store.open_session() as session:
+            stats = StreamQueryStatistics()
+            users = list(stream(session.query(object_type=User).order_by("Age"), stats))
+            self.assertEqual(expected, [(user.Id, user.name, user.age) for user in users])
+            self.assertEqual(USERS, stats.total_results)
+            self.assertIsNotNone(stats.index_name)
+            # Streamed results aren't tracked
+            self.assertFalse(session.advanced.is_loaded("users/1"))
+
+            # Projections like the client's own stream
+            def names_query():
+                return session.query(object_type=User).where_greater_than("Age", 9).select_fields(UserName, "Name")
+
+            expected = [vars(result.document) for result in session.advanced.stream(names_query())]
+            self.assertEqual(USERS - 10, len(expected))
+            self.assertEqual(expected, [vars(user) for user in stream(names_query())])
+
+    def test_stopping_early_closes_the_response(self):
+        with self.store.open_session() as session:
+            response_close = requests.Response.close
+            with mock.patch.object(requests.Response, "close", autospec=True, side_effect=response_close) as close:
+                users = stream(session.query(object_type=User))
+                next(users)
+                close.assert_not_called()
+                users.close()
+                close.assert_called_once()
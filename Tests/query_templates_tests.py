@@ -0,0 +1,63 @@
+from examples_base import ExampleBase, User
+from query_templates import QueryTemplate
+
+NAMES = ["John", "Jane", "Jim"]
+
+
+class QueryTemplates(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("QueryTemplates")
+        with self.store.open_session() as session:
+            for i in range(12):
+                session.store(User(name=NAMES[i % len(NAMES)], age=20 + i), f"users/{i}")
+            session.save_changes()
+
+        self.template = QueryTemplate(
+            lambda session, p: session.query(object_type=User)
+            .where_in("Name", p.names)
+            .and_also()
+            .where_greater_than_or_equal("Age", p.min_age)
+            .order_by_descending("Age")
+        )
+
+    def tearDown(self):
+        self.store.close()
+
+    def _query(self, session, names, min_age):
+        return (
+            session.query(object_type=User)
+            .where_in("Name", names)
+            .and_also()
+            .where_greater_than_or_equal("Age", min_age)
+            .order_by_descending("Age")
+            .wait_for_non_stale_results()
+        )
+
+    def test_runs_match_the_same_query_written_directly(self):
+        with self.store.open_session() as session:
+            # Creates the auto index
+            list(self._query(session, NAMES, 0))
+
+        for names, min_age in ((["John"], 0), (["Jane", "Jim"], 25), (NAMES, 30), (["Nobody"], 0)):
+            # Compiled by the first run, later runs with other sessions
+            with self.store.open_session() as session:
+                expected = list(self._query(session, names, min_age))
+                results = self.template.run(session, names=names, min_age=min_age)
+                self.assertEqual([user.Id for user in expected], [user.Id for user in results])
+                # The same entities, tracked by the session
+                for user, expected_user in zip(results, expected):
+                    self.assertIs(expected_user, user)
+
+            with self.store.open_session() as session:
+                direct = self._query(session, names, min_age).index_query
+                templated = self.template.index_query(session, names=names, min_age=min_age)
+                self.assertEqual(direct.query, templated.query)
+                self.assertEqual(direct.query_parameters, templated.query_parameters)
+
+    def test_parameter_values_are_checked(self):
+        with self.store.open_session() as session:
+            with self.assertRaises(ValueError):
+                self.template.run(session, names=NAMES)
+            with self.assertRaises(ValueError):
+                self.template.run(session, names=NAMES, min_age=0, max_age=100)
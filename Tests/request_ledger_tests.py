@@ -0,0 +1,67 @@
+import os
+import warnings
+
+from ravendb import DocumentStore
+
+from examples_base import ExampleBase, User
+from request_ledger import NPlusOneWarning, RequestLedger, enable_request_ledgers, request_ledger
+
+USERS = 10
+THRESHOLD = 3
+
+
+class RequestLedgerNPlusOne(ExampleBase):
+    def setUp(self):
+        super().setUp()
+        self.store = self.embedded_server.get_document_store("RequestLedgerNPlusOne")
+        with self.store.open_session() as session:
+            for i in range(USERS):
+                session.store(User(name=f"User {i}", age=i), f"users/{i}")
+            session.save_changes()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_single_loads_from_one_line_warn(self):
+        with self.store.open_session() as session:
+            ledger = RequestLedger(session, n_plus_one_threshold=THRESHOLD)
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                for i in range(USERS):
+                    session.load(f"users/{i}", User)
+
+        self.assertEqual(USERS, len(ledger))
+        self.assertEqual(["load"] * USERS, [entry.kind for entry in ledger.entries])
+        n_plus_one = [warning for warning in caught if issubclass(warning.category, NPlusOneWarning)]
+        # Once, when the threshold is reached, pointing at the load
+        self.assertEqual(1, len(n_plus_one))
+        self.assertEqual(__file__, n_plus_one[0].filename)
+        self.assertTrue(ledger.entries[0].call_site.endswith(f":{n_plus_one[0].lineno} in {self._testMethodName}"))
+
+    def test_loads_at_once_and_below_the_threshold_dont_warn(self):
+        with self.store.open_session() as session:
+            RequestLedger(session, n_plus_one_threshold=THRESHOLD)
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                session.load([f"users/{i}" for i in range(USERS)], User)
+                for i in range(THRESHOLD - 1):
+                    session.load(f"users/missing/{i}", User)
+                # Another line, counted on its own
+                session.load("users/missing/other", User)
+
+        self.assertFalse([warning for warning in caught if issubclass(warning.category, NPlusOneWarning)])
+
+    def test_exceeding_the_limit_lists_the_call_sites(self):
+        # Sessions take the limit from the conventions of the request executor, created by the first session
+        store = DocumentStore(self.store.urls, self.store.database)
+        store.conventions.max_number_of_requests_per_session = 2
+        enable_request_ledgers(store)
+        with store.initialize(), store.open_session() as session:
+            session.load("users/1", User)
+            session.load("users/2", User)
+            with self.assertRaises(ValueError) as raised:
+                session.load("users/3", User)
+            self.assertEqual(2, len(request_ledger(session)))
+        # Both loads, by their line
+        self.assertIn("Requests made by this session:\n2 requests", str(raised.exception))
+        self.assertEqual(2, str(raised.exception).count(f" load   {os.path.relpath(__file__)}:"))
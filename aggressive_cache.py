@@ -0,0 +1,153 @@
+"""
+Aggressive caching: loads and queries answered from the client's HTTP cache, without asking the server.
+
+The request executor caches the responses of read requests, but normally only to send their change vector
+along with the next request for the same URL, which the server answers with 304 Not Modified if nothing
+changed. Within aggressively_cache_for(), a cached response is used without any request, as long as it is
+younger than 'duration':
+
+    with aggressively_cache_for(store, timedelta(minutes=5)):
+        with store.open_session() as session:
+            employee = session.load("employees/1-A", Employee)
+
+In the default AggressiveCacheMode.TRACK_CHANGES mode the store also subscribes to document and index
+changes through the Changes API, every notification marks all the cached responses as possibly modified,
+so their next use revalidates them with the server (a notification arrives a few milliseconds after the
+change). With AggressiveCacheMode.DO_NOT_TRACK_CHANGES cached responses are used until they expire.
+The mode applies to the calling thread, to all the sessions of the store opened within it.
+"""
+
+import datetime
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from ravendb import AggressiveCacheOptions, DocumentStore, RequestExecutor
+from ravendb.changes.observers import ActionObserver
+from ravendb.documents.session.misc import SessionInfo
+from ravendb.http.misc import AggressiveCacheMode
+from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
+from ravendb.http.server_node import ServerNode
+
+
+class _AggressiveCaching:
+    """Aggressive caching state of one request executor (i.e. of one database of a store)."""
+
+    def __init__(self, request_executor: RequestExecutor):
+        self.request_executor = request_executor
+        self.local = threading.local()
+        self.tracking_changes = False
+        self._lock = threading.Lock()
+        self._execute = request_executor.execute
+        # Shadows the method, the request executor calls self.execute() for every command, retries included
+        request_executor.execute = self.execute
+
+    @property
+    def options(self) -> Optional[AggressiveCacheOptions]:
+        return getattr(self.local, "options", None)
+
+    def execute(
+        self,
+        chosen_node: ServerNode = None,
+        node_index: int = None,
+        command: RavenCommand = None,
+        should_retry: bool = None,
+        session_info: SessionInfo = None,
+        ret_request: bool = False,
+    ):
+        options = self.options
+        if options is not None and not ret_request:
+            if self._read_from_cache(options, chosen_node, command, session_info):
+                return None
+        return self._execute(chosen_node, node_index, command, should_retry, session_info, ret_request)
+
+    def _read_from_cache(
+        self,
+        options: AggressiveCacheOptions,
+        chosen_node: ServerNode,
+        command: RavenCommand,
+        session_info: Optional[SessionInfo],
+    ) -> bool:
+        if session_info is not None and session_info.no_caching:
+            return False
+        if not (
+            command.can_cache
+            and command.can_cache_aggressively
+            and command.is_read_request
+            and command.response_type == RavenCommandResponseType.OBJECT
+        ):
+            return False
+
+        # Same cache key as the request executor uses, the URL of the request
+        cached_item, _, cached_value = self.request_executor.cache.get(command.create_request(chosen_node).url)
+        if cached_item.item is None or cached_value is None:
+            return False
+        if options.mode == AggressiveCacheMode.TRACK_CHANGES and cached_item.might_have_been_modified:
+            return False
+        if cached_item.age > options.duration:
+            return False
+
+        command.set_response(cached_value, True)
+        return True
+
+    def track_changes(self, store: DocumentStore, database: Optional[str]) -> None:
+        with self._lock:
+            if self.tracking_changes:
+                return
+            changes = store.changes(database)
+            observer = ActionObserver(on_next=self._on_change, on_error=self._on_change)
+            for observable in (changes.for_all_documents(), changes.for_all_indexes()):
+                observable.subscribe_with_observer(observer)
+                observable.ensure_subscribe_now()
+            self.tracking_changes = True
+
+    def _on_change(self, _) -> None:
+        # Also called on errors, notifications may have been missed
+        self.request_executor.cache.generation += 1
+
+
+_install_lock = threading.Lock()
+
+
+def _get_aggressive_caching(store: DocumentStore, database: Optional[str]) -> _AggressiveCaching:
+    request_executor = store.get_request_executor(database)
+    with _install_lock:
+        aggressive_caching = getattr(request_executor.execute, "__self__", None)
+        if not isinstance(aggressive_caching, _AggressiveCaching):
+            aggressive_caching = _AggressiveCaching(request_executor)
+    return aggressive_caching
+
+
+@contextmanager
+def aggressively_cache_for(
+    store: DocumentStore,
+    duration: datetime.timedelta,
+    mode: AggressiveCacheMode = AggressiveCacheMode.TRACK_CHANGES,
+    database: Optional[str] = None,
+):
+    aggressive_caching = _get_aggressive_caching(store, database)
+    if mode == AggressiveCacheMode.TRACK_CHANGES:
+        aggressive_caching.track_changes(store, database)
+    previous = aggressive_caching.options
+    aggressive_caching.local.options = AggressiveCacheOptions(duration, mode)
+    try:
+        yield
+    finally:
+        aggressive_caching.local.options = previous
+
+
+def aggressively_cache(store: DocumentStore, database: Optional[str] = None):
+    """aggressively_cache_for() a day, relying on change notifications to revalidate what changed."""
+    return aggressively_cache_for(store, datetime.timedelta(days=1), database=database)
+
+
+@contextmanager
+def disable_aggressive_caching(store: DocumentStore, database: Optional[str] = None):
+    """Always asks the server, also within an aggressively_cache_for() block."""
+    aggressive_caching = _get_aggressive_caching(store, database)
+    previous = aggressive_caching.options
+    aggressive_caching.local.options = None
+    try:
+        yield
+    finally:
+        aggressive_caching.local.options = previous
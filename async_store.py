@@ -0,0 +1,197 @@
+"""
+asyncio API over the synchronous client.
+
+Calls that talk to the server run on the store's thread pool, so coroutines await them without blocking
+the event loop, and the number of threads is bounded by max_workers however many calls are in flight:
+
+    async with AsyncDocumentStore(store) as async_store:
+        async with async_store.open_session() as session:
+            employee = await session.load("employees/1-A", Employee)
+            employee.first_name = "Robert"
+            await session.save_changes()
+
+            orders = await session.to_list(session.query(object_type=Order).where_equals("Company", "companies/1-A"))
+
+        await async_store.send(PatchOperation(...))
+
+        async with async_store.bulk_insert() as bulk_insert:
+            await bulk_insert.store(employee)
+
+Queries are built as usual (building one doesn't contact the server) and run with to_list(), first() or count().
+Anything else a session can do runs with 'await session.run(lambda session: ...)'. The operations of one session
+run one at a time, sessions aren't thread safe.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Type, TypeVar, Union
+
+from ravendb import DocumentStore
+from ravendb.documents.bulk_insert_operation import BulkInsertOperation
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.query import DocumentQuery
+from ravendb.documents.subscriptions.worker import SubscriptionBatch, SubscriptionWorker
+from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
+
+_T = TypeVar("_T")
+
+
+class AsyncDocumentStore:
+    def __init__(self, store: DocumentStore, max_workers: Optional[int] = 16):
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="ravendb-async")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Waits for the calls in flight, the DocumentStore is left open."""
+        self._executor.shutdown()
+
+    async def run(self, function: Callable[..., _T], *args, **kwargs) -> _T:
+        """function(*args, **kwargs) on the store's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+
+    def open_session(self, database: Optional[str] = None, session_options=None) -> "AsyncDocumentSession":
+        return AsyncDocumentSession(self, database, session_options)
+
+    def bulk_insert(self, database: Optional[str] = None) -> "AsyncBulkInsert":
+        return AsyncBulkInsert(self, database)
+
+    async def send(self, operation, session_info=None):
+        return await self.run(self.store.operations.send, operation, session_info)
+
+    async def maintenance_send(self, operation):
+        return await self.run(self.store.maintenance.send, operation)
+
+    async def run_subscription(
+        self, worker: SubscriptionWorker, process_batch: Callable[[SubscriptionBatch], Union[None, Awaitable[None]]]
+    ) -> None:
+        """
+        Runs the subscription worker until it stops, like worker.run(process_batch).result().
+        process_batch may be a coroutine function, it runs on the calling event loop then.
+        Stop the worker with 'await async_store.run(worker.close)', not from process_batch.
+        """
+        loop = asyncio.get_running_loop()
+        if asyncio.iscoroutinefunction(process_batch):
+            coroutine_function = process_batch
+
+            def process_batch(batch: SubscriptionBatch) -> None:
+                # On the worker's thread, the batch is acknowledged once the coroutine completed
+                asyncio.run_coroutine_threadsafe(coroutine_function(batch), loop).result()
+
+        subscription_task: Future = worker.run(process_batch)
+        await asyncio.wrap_future(subscription_task, loop=loop)
+
+
+class AsyncDocumentSession:
+    def __init__(self, async_store: AsyncDocumentStore, database: Optional[str] = None, session_options=None):
+        self._async_store = async_store
+        self._database = database
+        self._session_options = session_options
+        self._session: Optional[DocumentSession] = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        # Opening the first session of a store may fetch the topology
+        self._session = await self._async_store.run(
+            self._async_store.store.open_session, self._database, self._session_options
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def session(self) -> DocumentSession:
+        """The synchronous session, for what doesn't contact the server, e.g. session.advanced.get_metadata_for()."""
+        if self._session is None:
+            raise RuntimeError("Open the session with 'async with async_store.open_session() as session' first")
+        return self._session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+    async def run(self, function: Callable[[DocumentSession], _T]) -> _T:
+        """function(session) on the store's thread pool, after the session's operations started before it."""
+        session = self.session
+        async with self._lock:
+            return await self._async_store.run(function, session)
+
+    async def load(
+        self, key_or_keys: Union[str, List[str]], object_type: Optional[Type[_T]] = None, includes=None
+    ) -> Union[Optional[_T], Dict[str, Optional[_T]]]:
+        return await self.run(lambda session: session.load(key_or_keys, object_type, includes))
+
+    async def store(self, entity: object, key: Optional[str] = None, change_vector: Optional[str] = None) -> None:
+        # Not only local, generating the id of a new entity may request a range of ids (HiLo)
+        await self.run(lambda session: session.store(entity, key, change_vector))
+
+    async def delete(self, key_or_entity: Union[str, object], expected_change_vector: Optional[str] = None) -> None:
+        await self.run(lambda session: session.delete(key_or_entity, expected_change_vector))
+
+    async def save_changes(self) -> None:
+        await self.run(lambda session: session.save_changes())
+
+    def query(self, *args, **kwargs) -> DocumentQuery:
+        return self.session.query(*args, **kwargs)
+
+    def query_collection(self, *args, **kwargs) -> DocumentQuery:
+        return self.session.query_collection(*args, **kwargs)
+
+    def query_index(self, *args, **kwargs) -> DocumentQuery:
+        return self.session.query_index(*args, **kwargs)
+
+    def query_index_type(self, *args, **kwargs) -> DocumentQuery:
+        return self.session.query_index_type(*args, **kwargs)
+
+    async def to_list(self, query: Iterable[_T]) -> List[_T]:
+        return await self.run(lambda session: list(query))
+
+    async def first(self, query: DocumentQuery[_T]) -> _T:
+        return await self.run(lambda session: query.first())
+
+    async def count(self, query: DocumentQuery) -> int:
+        return await self.run(lambda session: query.count())
+
+
+class AsyncBulkInsert:
+    def __init__(self, async_store: AsyncDocumentStore, database: Optional[str] = None):
+        self._async_store = async_store
+        self._database = database
+        self._bulk_insert: Optional[BulkInsertOperation] = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        self._bulk_insert = await self._async_store.run(self._async_store.store.bulk_insert, self._database)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # Sends what is still buffered and waits for the server to complete the operation
+        await self.run(self._bulk_insert.__exit__, exc_type, exc_val, exc_tb)
+
+    async def run(self, function: Callable[..., _T], *args) -> _T:
+        """function(*args) on the store's thread pool, after the calls started before it (concurrent calls abort it)."""
+        async with self._lock:
+            return await self._async_store.run(function, *args)
+
+    async def store(self, entity: object, metadata: Optional[MetadataAsDictionary] = None) -> str:
+        return await self.run(self._bulk_insert.store, entity, metadata)
+
+    async def store_as(self, entity: object, key: str, metadata: Optional[MetadataAsDictionary] = None) -> None:
+        await self.run(self._bulk_insert.store_as, entity, key, metadata or MetadataAsDictionary())
+
+    async def store_many(self, entities: Iterable[object]) -> None:
+        """Stores all of them with one hop to the thread pool, for large imports."""
+
+        def store_all() -> None:
+            for entity in entities:
+                self._bulk_insert.store(entity)
+
+        await self.run(store_all)
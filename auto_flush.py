@@ -0,0 +1,133 @@
+"""
+Auto-flushing session for long store loops.
+
+A session keeps everything it stores, and every time series append, counter increment or patch it defers,
+until save_changes() sends it all in one batch. AutoFlushingSession sends the pending batch whenever it
+grows past max_operations (or roughly max_bytes), then continues in a new session, so the memory and
+the size of each batch stay bounded:
+
+    with AutoFlushingSession(store, max_operations=1_000) as session:
+        for employee_id in employee_ids:
+            for hour in range(168):
+                session.time_series_for(employee_id, "HeartRates").append_single(...)
+        session.save_changes()  # the rest
+
+It is used like a session. Only the write path flushes: store(), delete(), and time_series_for() and
+counters_for(), whose appends and increments are deferred commands. Loads, queries and everything else
+never flush. Entities loaded or stored before a flush are no longer tracked after it: modifying them later
+has no effect, load them again instead. Every flush is a transaction of its own.
+"""
+
+from typing import Optional, Union
+
+from ravendb import DocumentStore
+from ravendb.documents.commands.batches import CountersBatchCommandData, TimeSeriesBatchCommandData
+from ravendb.documents.session.document_session import (
+    DocumentSession,
+    SessionDocumentCounters,
+    SessionDocumentTimeSeries,
+)
+from ravendb.documents.session.event_args import BeforeRequestEventArgs
+
+# Until a batch was sent, max_bytes can't be estimated, the first batch is capped at this many operations
+CALIBRATION_OPERATIONS = 100
+
+
+def pending_operations(session: DocumentSession) -> int:
+    """Entities the session tracks or deletes, plus deferred commands (every time series entry or counter counts)."""
+    operations = len(session.documents_by_entity) + len(session.deleted_entities)
+    for command in session._deferred_commands:
+        if isinstance(command, TimeSeriesBatchCommandData):
+            # The session merges all appends to the same time series into one command
+            operations += len(command.time_series._appends) + len(command.time_series._deletes)
+        elif isinstance(command, CountersBatchCommandData):
+            operations += len(command._counters.operations)
+        else:
+            operations += 1
+    return operations
+
+
+class AutoFlushingSession:
+    def __init__(
+        self,
+        store: DocumentStore,
+        max_operations: Optional[int] = 1_000,
+        max_bytes: Optional[int] = None,
+        database: Optional[str] = None,
+    ):
+        if not max_operations and not max_bytes:
+            raise ValueError("max_operations or max_bytes is required")
+        self._store = store
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self._database = database
+        self.flushes = 0
+        self._flushed_operations = 0
+        self._flushed_bytes = 0
+        self._session = store.open_session(database)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getattr__(self, name: str):
+        # Reads and everything else go to the current session as is, a flush would untrack what they loaded
+        return getattr(self._session, name)
+
+    def _flush_if_full(self) -> None:
+        # The batch queued so far is sent before the next write
+        if self._is_full():
+            self.flush()
+
+    def store(self, entity: object, key: Optional[str] = None, change_vector: Optional[str] = None) -> None:
+        self._flush_if_full()
+        self._session.store(entity, key, change_vector)
+
+    def delete(self, key_or_entity: Union[str, object], expected_change_vector: Optional[str] = None) -> None:
+        self._flush_if_full()
+        self._session.delete(key_or_entity, expected_change_vector)
+
+    def time_series_for(self, document_id: str, name: Optional[str] = None) -> SessionDocumentTimeSeries:
+        self._flush_if_full()
+        return self._session.time_series_for(document_id, name)
+
+    def counters_for(self, document_id: str) -> SessionDocumentCounters:
+        self._flush_if_full()
+        return self._session.counters_for(document_id)
+
+    def _is_full(self) -> bool:
+        operations = pending_operations(self._session)
+        if self.max_operations and operations >= self.max_operations:
+            return True
+        if self.max_bytes:
+            if not self._flushed_operations:
+                return operations >= CALIBRATION_OPERATIONS
+            # Average size of an operation in the batches sent so far
+            return operations * self._flushed_bytes / self._flushed_operations >= self.max_bytes
+        return False
+
+    def _measure_batch(self, event_args: BeforeRequestEventArgs) -> None:
+        if "/bulk_docs" in event_args.url and isinstance(event_args.request.data, bytes):
+            self._flushed_bytes += len(event_args.request.data)
+
+    def save_changes(self) -> None:
+        operations = pending_operations(self._session)
+        request_executor = self._session.request_executor
+        request_executor.add_on_before_request(self._measure_batch)
+        try:
+            self._session.save_changes()
+        finally:
+            request_executor.remove_on_before_request(self._measure_batch)
+        self._flushed_operations += operations
+
+    def flush(self) -> None:
+        """Sends the pending batch and continues in a new session, releasing everything the old one tracked."""
+        self.save_changes()
+        self._session.close()
+        self._session = self._store.open_session(self._database)
+        self.flushes += 1
+
+    def close(self) -> None:
+        self._session.close()
@@ -0,0 +1,227 @@
+import gc
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from importlib.metadata import version
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from ravendb import DocumentStore
+from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
+
+from examples_base import ExampleServer, SharedEmbeddedServer, User
+from json_backend import installed_json_backend
+
+try:
+    import resource
+except ImportError:
+    # Windows, peak RSS isn't measured there
+    resource = None
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else None
+
+
+class PeakRssSampler:
+    """
+    Samples the resident set size of this process while a benchmark runs.
+    ru_maxrss is the peak of the whole process, so it can't tell benchmarks apart,
+    this resets the peak at the start of every benchmark instead.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def current_rss() -> int:
+        if PAGE_SIZE is not None:
+            try:
+                with open("/proc/self/statm") as statm:
+                    return int(statm.read().split()[1]) * PAGE_SIZE
+            except OSError:
+                pass
+        if resource is not None:
+            # No procfs (e.g. macOS), fall back to the process-wide peak, in bytes there
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return 0
+
+    def _sample(self):
+        while not self._stopped.wait(self.interval):
+            self.peak = max(self.peak, self.current_rss())
+
+    def __enter__(self):
+        self.peak = self.current_rss()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current_rss())
+
+
+class BenchmarkResult:
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        iterations: int,
+        operations: int,
+        total_seconds: float,
+        latencies_ms: np.ndarray,
+        peak_rss_bytes: int,
+    ):
+        self.name = name
+        self.size = size
+        self.iterations = iterations
+        self.operations = operations
+        self.total_seconds = total_seconds
+        self.ops_per_sec = operations / total_seconds if total_seconds else 0.0
+        self.p50_ms = float(np.percentile(latencies_ms, 50))
+        self.p99_ms = float(np.percentile(latencies_ms, 99))
+        self.peak_rss_mb = peak_rss_bytes / (1024 * 1024)
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "Name": self.name,
+            "Size": self.size,
+            "Iterations": self.iterations,
+            "Operations": self.operations,
+            "TotalSeconds": round(self.total_seconds, 6),
+            "OpsPerSec": round(self.ops_per_sec, 3),
+            "P50Ms": round(self.p50_ms, 4),
+            "P99Ms": round(self.p99_ms, 4),
+            "PeakRssMb": round(self.peak_rss_mb, 2),
+        }
+
+
+class BenchmarkBase:
+    """
+    Base class of the benchmarks, the counterpart of ExampleBase.
+
+    Every bench_* method is timed separately, at every size in 'sizes'.
+    set_up(size) runs first, against a fresh database in self.store,
+    then the bench_* method is called 'iterations' times (after 'warmup' untimed calls).
+    A call may return the number of operations it performed (e.g. documents inserted),
+    otherwise it counts as one operation. Latency percentiles are per call.
+    """
+
+    sizes = [100, 1_000, 10_000]
+    iterations = 50
+    warmup = 3
+
+    def __init__(self, server: ExampleServer):
+        self.server = server
+        self.store: Optional[DocumentStore] = None
+
+    @classmethod
+    def database_name(cls, size: int) -> str:
+        return f"{cls.__name__}-{size}"
+
+    def set_up(self, size: int) -> None:
+        pass
+
+    def tear_down(self, size: int) -> None:
+        pass
+
+    @classmethod
+    def benchmark_methods(cls) -> List[str]:
+        return sorted(name for name in dir(cls) if name.startswith("bench_") and callable(getattr(cls, name)))
+
+    def run_benchmark(self, method_name: str, size: int, iterations: Optional[int] = None) -> BenchmarkResult:
+        iterations = iterations or self.iterations
+        bench: Callable[[int], Optional[int]] = getattr(self, method_name)
+        with self.server.get_document_store(self.database_name(size)) as store:
+            self.store = store
+            try:
+                self.set_up(size)
+                for iteration in range(self.warmup):
+                    bench(iteration)
+
+                latencies = np.empty(iterations)
+                operations = 0
+                gc.collect()
+                with PeakRssSampler() as rss:
+                    started = time.perf_counter()
+                    for iteration in range(iterations):
+                        call_started = time.perf_counter_ns()
+                        performed = bench(self.warmup + iteration)
+                        latencies[iteration] = (time.perf_counter_ns() - call_started) / 1e6
+                        operations += 1 if performed is None else performed
+                    total_seconds = time.perf_counter() - started
+            finally:
+                self.tear_down(size)
+                self.store = None
+
+        name = f"{type(self).__module__}.{type(self).__name__}.{method_name}"
+        return BenchmarkResult(name, size, iterations, operations, total_seconds, latencies, rss.peak)
+
+
+def get_benchmark_server() -> ExampleServer:
+    # Same shared server as the examples, the 'bench-' prefix keeps the databases apart
+    return ExampleServer(SharedEmbeddedServer.get(), "bench-")
+
+
+def environment_info() -> Dict[str, Any]:
+    return {
+        "Python": sys.version.split()[0],
+        "Platform": platform.platform(),
+        "RavenDB": version("ravendb"),
+        "Cpus": os.cpu_count(),
+        "Json": installed_json_backend(),
+    }
+
+
+def save_results(results: List[BenchmarkResult], path: str) -> None:
+    with open(path, "w") as file:
+        json.dump(
+            {"Environment": environment_info(), "Results": [result.to_json() for result in results]}, file, indent=2
+        )
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path) as file:
+        return {f"{result['Name']}[{result['Size']}]": result for result in json.load(file)["Results"]}
+
+
+def compare_with_baseline(
+    results: List[BenchmarkResult], baseline: Dict[str, Dict[str, Any]], threshold: float = 0.1
+) -> List[str]:
+    """
+    Returns a description of every regression beyond 'threshold' (a fraction, 0.1 = 10%):
+    lower ops/sec, higher p99 latency or higher peak RSS than in the baseline.
+    Benchmarks missing from the baseline are skipped.
+    """
+    regressions = []
+    for result in results:
+        saved = baseline.get(result.key)
+        if saved is None:
+            continue
+        checks = [
+            ("ops/sec", saved["OpsPerSec"], result.ops_per_sec, -1),
+            ("p99 ms", saved["P99Ms"], result.p99_ms, 1),
+            ("peak RSS MB", saved["PeakRssMb"], result.peak_rss_mb, 1),
+        ]
+        for metric, before, after, direction in checks:
+            if before and (after - before) / before * direction > threshold:
+                regressions.append(f"{result.key}: {metric} {before:.2f} -> {after:.2f}")
+    return regressions
+
+
+def insert_users(store: DocumentStore, count: int) -> List[str]:
+    keys = [f"users/{number}-A" for number in range(1, count + 1)]
+    with store.bulk_insert() as bulk_insert:
+        for number, key in enumerate(keys):
+            bulk_insert.store_as(User(key, f"User {number}", 18 + number % 60), key, MetadataAsDictionary())
+    return keys
@@ -0,0 +1,135 @@
+"""
+Memory-bounded sessions.
+
+A session keeps every entity it loads, and the JSON it was loaded from, until it is closed or the entity
+is evicted with session.advanced.evict(). BoundedTracking evicts the least recently used entities of a
+session when it tracks more than max_entities documents (or roughly max_bytes of their JSON) as its next
+request starts, so a batch job can walk any number of documents in one session:
+
+    with open_bounded_session(store, max_entities=10_000) as session:
+        for order in session.query(object_type=Order):
+            ...
+        session.save_changes()
+
+Loading or querying an entity makes it the most recently used one. The results of a load or query stay
+tracked, however many there are, at least until the session sends its next request (a load, a query or
+save_changes()). Only unmodified entities are evicted: new ones, modified ones (including their metadata)
+and deleted ones stay tracked until save_changes(), so they may keep a session above its limit. An evicted
+entity is an ordinary object, modifying it later has no effect, load it again instead. Entities are compared
+with their JSON like save_changes() does before they are evicted, a modified DirtyTracked entity is kept
+without being serialized.
+"""
+
+from collections import OrderedDict
+from typing import Optional, Type, TypeVar
+
+from ravendb import DocumentStore
+from ravendb.documents.session.document_info import DocumentInfo
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.event_args import AfterSaveChangesEventArgs
+
+from dirty_tracking import DirtyTracked, is_dirty
+from json_backend import default_json_backend
+
+_T = TypeVar("_T")
+
+_json = default_json_backend()
+
+
+class BoundedTracking:
+    def __init__(self, session: DocumentSession, max_entities: Optional[int] = None, max_bytes: Optional[int] = None):
+        if not max_entities and not max_bytes:
+            raise ValueError("max_entities or max_bytes is required")
+        self.max_entities = max_entities
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self.tracked_bytes = 0
+        self._session = session
+        # Document id -> estimated size of its JSON, least recently used first
+        self._lru: "OrderedDict[str, int]" = OrderedDict()
+
+        track_entity = session.track_entity
+        increment_requests_count = session.increment_requests_count
+
+        def track_entity_and_touch(
+            entity_type: Type[_T], key: Optional[str], document: dict, metadata: dict, no_tracking: bool
+        ) -> _T:
+            entity = track_entity(entity_type, key, document, metadata, no_tracking)
+            if key and not (no_tracking or session.no_tracking):
+                self._touch(key, document)
+            return entity
+
+        def evict_and_increment_requests_count() -> None:
+            # Called as every load, query, lazy operation or save_changes() starts, before it tracks anything:
+            # the results the caller got from the previous operations may be evicted, never its own
+            self._evict_if_needed()
+            increment_requests_count()
+
+        # Shadow the methods, loads, queries and lazy operations all track their results through the first one
+        session.track_entity = track_entity_and_touch
+        session.increment_requests_count = evict_and_increment_requests_count
+        session.add_after_save_changes(self._on_after_save_changes)
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def _touch(self, key: str, document: dict) -> None:
+        key = key.lower()
+        size = self._lru.pop(key, None)
+        if size is None:
+            size = len(_json.dumps(document)) if self.max_bytes and document is not None else 0
+            self.tracked_bytes += size
+        self._lru[key] = size
+
+    def _on_after_save_changes(self, event_args: AfterSaveChangesEventArgs) -> None:
+        # Stored and modified entities are clean again once saved, and can be evicted from now on
+        document_info = self._session.documents_by_entity.get(event_args.entity)
+        if document_info is not None:
+            self._touch(document_info.key, document_info.document)
+
+    def _is_over_limit(self) -> bool:
+        return bool(
+            (self.max_entities and len(self._lru) > self.max_entities)
+            or (self.max_bytes and self.tracked_bytes > self.max_bytes)
+        )
+
+    def _evict_if_needed(self) -> None:
+        # Every entry is looked at once at most, what isn't evicted is either gone or modified
+        for _ in range(len(self._lru)):
+            if not self._is_over_limit():
+                return
+            key, size = self._lru.popitem(last=False)
+            self.tracked_bytes -= size
+            document_info = self._session.documents_by_id.get_value(key)
+            if document_info is None or document_info.entity is None:
+                # Evicted or cleared by the caller already
+                continue
+            if not self._is_clean(document_info):
+                # Saving it adds it back, see _on_after_save_changes()
+                continue
+            self._session.advanced.evict(document_info.entity)
+            self.evictions += 1
+
+    def _is_clean(self, document_info: DocumentInfo) -> bool:
+        session = self._session
+        if document_info.new_document or document_info.entity in session.deleted_entities:
+            return False
+        if document_info.metadata_instance is not None and document_info.metadata_instance.is_dirty:
+            return False
+        if isinstance(document_info.entity, DirtyTracked) and is_dirty(document_info.entity):
+            return False
+        # Even a clean DirtyTracked entity may have an in-place change of a nested value, without mark_dirty()
+        document = session.entity_to_json.convert_entity_to_json(document_info.entity, document_info)
+        return not session._entity_changed(document, document_info, None)
+
+
+def open_bounded_session(
+    store: DocumentStore,
+    max_entities: Optional[int] = 10_000,
+    max_bytes: Optional[int] = None,
+    database: Optional[str] = None,
+) -> DocumentSession:
+    """Opens a session with BoundedTracking, available as session.bounded_tracking."""
+    session = store.open_session(database)
+    session.bounded_tracking = BoundedTracking(session, max_entities, max_bytes)
+    return session
@@ -1,6 +1,7 @@
 import datetime
-import random
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
 
 
 class Camera:
@@ -32,18 +33,86 @@ MANUFACTURERS = ["Sony", "Nikon", "Phillips", "Canon", "Jessops"]
 MODELS = ["Model1", "Model2", "Model3", "Model4", "Model5"]
 
 
-def get_cameras(num_cameras: int) -> List[Camera]:
-    camera_list = []
-    for i in range(1, num_cameras):
-        camera = Camera(
-            date_of_listing=datetime.datetime(80 + random.randint(1, 30), random.randint(1, 12), random.randint(1, 27)),
-            manufacturer=MANUFACTURERS[random.randint(0, len(MANUFACTURERS) - 1)],
-            model=MODELS[random.randint(0, len(MODELS) - 1)],
-            cost=random.randint(0, 100) * 9 + 100,
-            zoom=random.randint(0, 10) + 1,
-            megapixels=random.randint(0, 10) + 1,
-            image_stabilizer=random.randint(0, 100) > 60,
-            advanced_features=["??"],
-        )
-        camera_list.append(camera)
-    return camera_list
+class CameraColumns:
+    """
+    Camera attributes as NumPy column arrays, one row per camera.
+    Cameras are materialized lazily, one at a time, by cameras() or documents().
+    """
+
+    def __init__(
+        self,
+        date_of_listing: np.ndarray,
+        manufacturer: np.ndarray,
+        model: np.ndarray,
+        cost: np.ndarray,
+        zoom: np.ndarray,
+        megapixels: np.ndarray,
+        image_stabilizer: np.ndarray,
+    ):
+        self.date_of_listing = date_of_listing
+        self.manufacturer = manufacturer
+        self.model = model
+        self.cost = cost
+        self.zoom = zoom
+        self.megapixels = megapixels
+        self.image_stabilizer = image_stabilizer
+
+    def __len__(self) -> int:
+        return len(self.cost)
+
+    def cameras(self) -> Iterator[Camera]:
+        # tolist() converts whole columns to Python values at once, instead of one NumPy scalar at a time
+        for date_of_listing, manufacturer, model, cost, zoom, megapixels, image_stabilizer in zip(
+            self.date_of_listing.astype("datetime64[us]").tolist(),
+            self.manufacturer.tolist(),
+            self.model.tolist(),
+            self.cost.tolist(),
+            self.zoom.tolist(),
+            self.megapixels.tolist(),
+            self.image_stabilizer.tolist(),
+        ):
+            yield Camera(
+                date_of_listing=date_of_listing,
+                manufacturer=MANUFACTURERS[manufacturer],
+                model=MODELS[model],
+                cost=cost,
+                zoom=zoom,
+                megapixels=megapixels,
+                image_stabilizer=image_stabilizer,
+                advanced_features=["??"],
+            )
+
+    def documents(self) -> Iterator[Tuple[str, Camera]]:
+        """
+        (document id, camera) pairs ready for bulk_insert.store_as, which then doesn't need to generate
+        an id for every camera. Pass it a new MetadataAsDictionary() for every camera, its default is shared.
+        """
+        for number, camera in enumerate(self.cameras(), 1):
+            camera.Id = f"cameras/{number}-A"
+            yield camera.Id, camera
+
+
+def generate_camera_columns(num_cameras: int, seed: Optional[int] = None) -> CameraColumns:
+    # Same value ranges as the original random.randint-based generator, drawn as whole columns
+    rng = np.random.default_rng(seed)
+    years = 80 + rng.integers(1, 31, num_cameras)
+    months = rng.integers(1, 13, num_cameras)
+    days = rng.integers(1, 28, num_cameras)
+    date_of_listing = (
+        (years - 1970).astype("datetime64[Y]").astype("datetime64[M]")
+        + (months - 1).astype("timedelta64[M]")
+    ).astype("datetime64[D]") + (days - 1).astype("timedelta64[D]")
+
+    return CameraColumns(
+        date_of_listing=date_of_listing,
+        manufacturer=rng.integers(0, len(MANUFACTURERS), num_cameras),
+        model=rng.integers(0, len(MODELS), num_cameras),
+        cost=rng.integers(0, 101, num_cameras) * 9 + 100,
+        zoom=rng.integers(0, 11, num_cameras) + 1,
+        megapixels=rng.integers(0, 11, num_cameras) + 1,
+        image_stabilizer=rng.integers(0, 101, num_cameras) > 60,
+    )
+
+
+def get_cameras(num_cameras: int, seed: Optional[int] = None) -> List[Camera]:
+    return list(generate_camera_columns(num_cameras, seed).cameras())
@@ -0,0 +1,65 @@
+"""
+Fast parsing of the timestamps RavenDB stores, e.g. '1996-07-04T00:00:00.0000000' (optionally with a trailing 'Z').
+
+These give the same naive datetime as Utils.string_to_datetime, with the 7th fractional digit truncated.
+Anything else datetime.fromisoformat() accepts parses as well, where Utils.string_to_datetime raises
+ValueError: dates alone, times without a fraction, and timestamps with an offset, which are converted
+to naive UTC (like parse_datetime_column does).
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from ravendb.tools.utils import Utils
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Result sets repeat the same timestamps a lot (e.g. every order of a day), the cache is bounded
+# so that a column of unique timestamps only costs a cache miss per value
+DATETIME_CACHE_SIZE = 16_384
+
+# 'YYYY-MM-DDTHH:MM:SS.fffffff', the format the server writes
+RAVEN_DATETIME_LENGTH = 27
+
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if value[-1:] == "Z":
+        value = value[:-1]
+    if len(value) == RAVEN_DATETIME_LENGTH and value[10] == "T" and value[19] == "." and value[20:].isdigit():
+        # Fixed format, parsed without trying other formats first (microseconds only, like strptime's %f)
+        return datetime.fromisoformat(value[:26])
+    try:
+        result = datetime.fromisoformat(value)
+    except ValueError:
+        return Utils.string_to_datetime(value)
+    if result.tzinfo is not None:
+        result = result.astimezone(timezone.utc).replace(tzinfo=None)
+    return result
+
+
+def parse_datetime_column(values: Iterable[Optional[str]]) -> "np.ndarray":
+    """
+    Parses a whole column of timestamps at once, into a datetime64[us] array (None becomes NaT).
+    NumPy parses the strings in C, .tolist() turns the array back into datetime objects (and None).
+    datetime64 has no time zone, timestamps with an offset are converted to UTC.
+    """
+    # Imported here, every example imports this module through the entity schemas
+    import numpy as np
+
+    return np.array([_to_datetime64_value(value) for value in values], dtype="datetime64[us]")
+
+
+def _to_datetime64_value(value: Optional[str]) -> Union[None, str, datetime]:
+    if value is None:
+        return None
+    if value[-1:] == "Z":
+        return value[:-1][:26]
+    if "+" in value or value.find("-", 19) != -1:
+        # An offset after the time, cutting the digits would cut it off too
+        return parse_datetime(value)
+    return value[:26]
@@ -0,0 +1,108 @@
+"""
+Opt-in dirty-flag change tracking.
+
+By default, save_changes() serializes every entity the session tracks and compares it with the JSON it was
+loaded from, to find the modified ones. Entities deriving from DirtyTracked instead record their own
+modifications, and a store with dirty tracking enabled skips the clean ones without serializing them:
+
+    class TrackedEmployee(DirtyTracked, Employee):
+        __slots__ = ()  # for a slotted entity, keeps its layout (and its __dict__ view)
+
+    class TrackedUser(DirtyTracked, User): ...
+
+    employee = session.load("employees/1-A", TrackedEmployee)  # stored as an Employee, loads all the same
+
+    store = DocumentStore(urls, database)
+    enable_dirty_tracking(store)  # before store.initialize(), conventions are frozen after it
+    store.initialize()
+
+Only assignments to the entity's own attributes mark it dirty, after an in-place change of a nested value
+(e.g. employee.notes.append(...) or employee.address.city = ...) call mark_dirty(employee).
+has_changed(), has_changes() and what_changed() still compare the JSON of every entity,
+see incremental_changes.py for a what_changed() that skips the clean ones as well.
+"""
+
+from itertools import count
+from weakref import WeakKeyDictionary
+
+from ravendb import DocumentStore
+from ravendb.documents.conventions import ShouldIgnoreEntityChanges
+from ravendb.documents.session.event_args import AfterSaveChangesEventArgs, SessionCreatedEventArgs
+
+# Numbers the modifications of all DirtyTracked entities, a modified entity keeps the number of its last one
+_modifications = count(1)
+# Modified entity -> number of its last modification, clean entities aren't in it
+_dirty: "WeakKeyDictionary[DirtyTracked, int]" = WeakKeyDictionary()
+
+
+class DirtyTracked:
+    """
+    Marks the entity dirty on any attribute assignment, except the first one of each attribute
+    (made while constructing it, e.g. in from_json) and the session setting the document id.
+    Adds nothing to the instances, the dirty flags are kept by weak reference: the entity class
+    must support them, like plain classes and SlotsEntity do.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The client only calls a from_json of the class itself, otherwise it builds the entity on its own,
+        # which fails for slotted entities. Delegates to the inherited one, which may be replaced later
+        if "from_json" not in cls.__dict__ and callable(getattr(cls, "from_json", None)):
+
+            def from_json(klass, json_dict, _cls=cls):
+                return super(_cls, klass).from_json(json_dict)
+
+            cls.from_json = classmethod(from_json)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name != "Id":
+            try:
+                getattr(self, name)
+            except AttributeError:
+                pass
+            else:
+                _dirty[self] = next(_modifications)
+        object.__setattr__(self, name, value)
+
+
+def is_dirty(entity: object) -> bool:
+    # Entities that don't track themselves always count as dirty, tracked ones are clean until modified
+    return not isinstance(entity, DirtyTracked) or entity in _dirty
+
+
+def last_modification(entity: DirtyTracked) -> int:
+    """Number of the entity's last modification, 0 if it is clean."""
+    return _dirty.get(entity, 0)
+
+
+def mark_dirty(entity: DirtyTracked) -> None:
+    _dirty[entity] = next(_modifications)
+
+
+def mark_clean(entity: DirtyTracked) -> None:
+    _dirty.pop(entity, None)
+
+
+class IgnoreCleanEntities(ShouldIgnoreEntityChanges):
+    def check(self, session_operations, entity: object, document_id: str) -> bool:
+        if is_dirty(entity):
+            return False
+        document_info = session_operations.documents_by_id.get_value(document_id)
+        # New documents have nothing to compare with yet, and modified metadata has to be saved as well
+        return document_info is not None and document_info.document is not None and document_info.metadata_instance is None
+
+
+def _mark_saved_entity_clean(event_args: AfterSaveChangesEventArgs) -> None:
+    if isinstance(event_args.entity, DirtyTracked):
+        mark_clean(event_args.entity)
+
+
+def _track_session(event_args: SessionCreatedEventArgs) -> None:
+    event_args.session.add_after_save_changes(_mark_saved_entity_clean)
+
+
+def enable_dirty_tracking(store: DocumentStore) -> None:
+    store.conventions.should_ignore_entity_changes = IgnoreCleanEntities()
+    store.add_on_session_creation(_track_session)
@@ -0,0 +1,174 @@
+"""
+Store-level cache of loaded documents, shared by all sessions of a store.
+
+Every session starts out empty, so a document every request handler needs (e.g. the current employee)
+is fetched from the server again in each of them. DocumentCache keeps the JSON of the documents loaded
+through it, by id, and turns it into a new entity for every session that loads it again:
+
+    cache = DocumentCache(store)  # after store.initialize()
+
+    with store.open_session() as session:
+        employee = cache.load(session, "employees/1-A", Employee)
+        employee.first_name = "Robert"  # tracked by the session like any loaded entity
+        session.save_changes()
+
+Cached documents are invalidated by the Changes API (a notification arrives a few milliseconds after
+a document is modified, so a load in between can still see the previous version), and right away when
+a session of the same store saves or deletes them. With use_changes=False every cache hit is revalidated
+with a conditional load instead, which costs a request but only transfers the document if it changed.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Type, TypeVar
+
+from ravendb import DocumentStore
+from ravendb.changes.observers import ActionObserver
+from ravendb.changes.types import DocumentChange
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.event_args import (
+    AfterSaveChangesEventArgs,
+    BeforeDeleteEventArgs,
+    SessionCreatedEventArgs,
+)
+from ravendb.primitives import constants
+
+_T = TypeVar("_T")
+
+
+class DocumentCache:
+    def __init__(self, store: DocumentStore, max_documents: int = 1_024, use_changes: bool = True):
+        self.max_documents = max_documents
+        self.use_changes = use_changes
+        self.hits = 0
+        self.misses = 0
+        self._store = store
+        self._documents: OrderedDict[str, Tuple[dict, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation, a document loaded while it changed isn't cached
+        self._invalidations = 0
+        self._unsubscribe = None
+
+        store.add_on_session_creation(self._track_session)
+        if use_changes:
+            changes = store.changes().for_all_documents()
+            self._unsubscribe = changes.subscribe_with_observer(
+                ActionObserver(on_next=self._on_document_change, on_error=self._on_changes_error)
+            )
+            changes.ensure_subscribe_now()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def load(self, session: DocumentSession, key: str, object_type: Optional[Type[_T]] = None) -> Optional[_T]:
+        """session.load(key, object_type), from the cache if the document is in it."""
+        if session.advanced.is_loaded(key):
+            return session.load(key, object_type)
+
+        with self._lock:
+            cached = self._documents.get(key.lower())
+            if cached is None:
+                self.misses += 1
+            else:
+                self._documents.move_to_end(key.lower())
+                # Without the Changes API a cached document only counts as a hit once revalidated
+                if self.use_changes:
+                    self.hits += 1
+            invalidations = self._invalidations
+
+        if cached is not None and not self.use_changes:
+            change_vector = cached[1][constants.Documents.Metadata.CHANGE_VECTOR]
+            result = session.advanced.conditional_load(key, change_vector, object_type)
+            modified = result.entity is not None or result.change_vector is None
+            with self._lock:
+                if modified:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+            if modified:
+                # Modified (and now tracked by the session) or deleted
+                self._add(session, key, result.entity, invalidations)
+                return result.entity
+
+        if cached is None:
+            entity = session.load(key, object_type)
+            self._add(session, key, entity, invalidations)
+            return entity
+
+        document, metadata = cached
+        # The session updates the metadata of a document in place when it saves it, every session gets its own.
+        # The document itself is only read, converting it into an entity copies it
+        metadata = dict(metadata)
+        document = {**document, constants.Documents.Metadata.KEY: metadata}
+        return session.track_entity(object_type, key, document, metadata, False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._documents.pop(key.lower(), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._documents.clear()
+
+    def close(self) -> None:
+        self._store.remove_on_session_creation(self._track_session)
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self.clear()
+
+    def _add(self, session: DocumentSession, key: str, entity: Optional[object], invalidations: int) -> None:
+        if entity is None:
+            self.invalidate(key)
+            return
+        if session.no_tracking:
+            return
+        document_info = session.documents_by_id.get_value(key)
+        with self._lock:
+            if invalidations != self._invalidations:
+                return
+            self._documents[key.lower()] = (document_info.document, dict(document_info.metadata))
+            self._documents.move_to_end(key.lower())
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+
+    def _on_document_change(self, change: DocumentChange) -> None:
+        self.invalidate(change.key)
+
+    def _on_changes_error(self, exception: Exception) -> None:
+        # Notifications may have been missed
+        self.clear()
+
+    def _invalidate_saved(self, event_args: AfterSaveChangesEventArgs) -> None:
+        self.invalidate(event_args.document_id)
+
+    def _invalidate_deleted(self, event_args: BeforeDeleteEventArgs) -> None:
+        self.invalidate(event_args.key)
+
+    def _track_session(self, event_args: SessionCreatedEventArgs) -> None:
+        session = event_args.session
+        session.add_after_save_changes(self._invalidate_saved)
+        session.add_before_delete(self._invalidate_deleted)
+
+        save_changes = session.save_changes
+
+        def save_changes_invalidating_deferred() -> None:
+            # No event is raised for the documents of deferred commands, e.g. deletes by id of documents
+            # the session didn't load, or patches
+            keys = {command.key for command in session.deferred_commands_map if command.key}
+            try:
+                save_changes()
+            finally:
+                for key in keys:
+                    self.invalidate(key)
+
+        # Shadows the method, like the session events it only applies to this session
+        session.save_changes = save_changes_invalidating_deferred
@@ -0,0 +1,108 @@
+"""
+Coalescing of concurrent loads into one request (DataLoader style).
+
+Web handlers usually load their documents one at a time, each in its own session, so N concurrent
+handlers cost N round trips. A DocumentLoader shared by all of them collects the ids loaded within
+a short window and fetches them with a single GetDocumentsCommand, every caller then gets its entity
+in its own session, tracked like any loaded entity:
+
+    loader = DocumentLoader(store)  # one per store, shared by all threads
+
+    def handle_request(employee_id):
+        with store.open_session() as session:
+            employee = loader.load(session, employee_id, Employee)
+
+The first load of a batch waits up to 'window' seconds for others to join it (less if max_batch_size ids
+are collected first), so a load that no other thread joins is 'window' slower than session.load().
+Without concurrency, use session.load(*ids) or session.advanced.lazily as before.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Dict, Optional, Type, TypeVar
+
+from ravendb import DocumentStore
+from ravendb.documents.commands.crud import GetDocumentsCommand
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.primitives import constants
+
+_T = TypeVar("_T")
+
+
+class _Batch:
+    def __init__(self):
+        self.documents: Dict[str, Future] = {}
+        self.full = threading.Event()
+
+
+class DocumentLoader:
+    def __init__(
+        self, store: DocumentStore, window: float = 0.001, max_batch_size: int = 256, database: Optional[str] = None
+    ):
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.requests = 0
+        self._store = store
+        self._database = database
+        self._lock = threading.Lock()
+        self._batch: Optional[_Batch] = None
+
+    def load(self, session: DocumentSession, key: str, object_type: Optional[Type[_T]] = None) -> Optional[_T]:
+        """session.load(key, object_type), batched with the loads of other threads."""
+        if session.advanced.is_loaded(key):
+            # Loaded, or known to be missing, already
+            return session.load(key, object_type)
+
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _Batch()
+            document = batch.documents.get(key.lower())
+            if document is None:
+                document = batch.documents[key.lower()] = Future()
+            if len(batch.documents) >= self.max_batch_size:
+                self._batch = None
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._fetch(batch)
+
+        document = document.result()
+        if document is None:
+            session.register_missing(key)
+            return None
+        # Shared by all the callers, only the metadata is updated in place by the session (when saving it)
+        metadata = dict(document[constants.Documents.Metadata.KEY])
+        document = {**document, constants.Documents.Metadata.KEY: metadata}
+        return session.track_entity(object_type, key, document, metadata, False)
+
+    def _fetch(self, batch: _Batch) -> None:
+        found: Dict[str, dict] = {}
+        error: Optional[BaseException] = None
+        try:
+            command = GetDocumentsCommand.from_multiple_ids(list(batch.documents))
+            self._store.get_request_executor(self._database).execute_command(command)
+            with self._lock:
+                self.requests += 1
+            # No result if none of them exists, otherwise the results aren't in the order of the ids
+            results = command.result.results if command.result is not None else []
+            found = {
+                document[constants.Documents.Metadata.KEY][constants.Documents.Metadata.ID].lower(): document
+                for document in results
+                if document is not None
+            }
+        except BaseException as e:
+            # Raised by document.result() in every caller of the batch, the leader included
+            error = e
+        finally:
+            # Whatever happened, no caller may be left waiting
+            for key, document in batch.documents.items():
+                if error is not None:
+                    document.set_exception(error)
+                else:
+                    document.set_result(found.get(key))
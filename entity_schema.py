@@ -0,0 +1,214 @@
+"""
+Declarative JSON schema for entity classes.
+
+Instead of hand-writing to_json/from_json, an entity lists its fields in constructor order:
+
+    @json_schema(
+        Field("Id", optional=True),
+        Field("name"),
+        DateTimeField("ordered_at"),
+        EntityField("ship_to", "Address"),
+        EntityListField("lines", "OrderLine"),
+    )
+    class Order(RavenOrder): ...
+
+The JSON name of a field defaults to its attribute name in PascalCase ('ship_to' -> 'ShipTo').
+The first to_json/from_json call on a class generates the source of both functions,
+specialized to its fields, and compiles it. The compiled functions replace the placeholders,
+so later calls don't walk the schema at all.
+Compilation is deferred to the first call so nested entity classes may be declared later in the module.
+
+With slots=True the class is rebuilt as a dataclass(slots=True) with the schema fields as its slots,
+instead of a __dict__ per instance. SlotsEntity gives such classes the __dict__ view the client expects.
+"""
+
+import sys
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field as dataclass_field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type
+
+from ravendb.tools.utils import Utils
+
+from datetime_helper import parse_datetime
+
+
+def pascal_case(attribute: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in attribute.split("_"))
+
+
+class Field:
+    """
+    A plain JSON value. With optional=True a missing key is read as None,
+    otherwise from_json raises KeyError for it, like the hand-written serializers did.
+    """
+
+    def __init__(self, attribute: str, json_name: Optional[str] = None, optional: bool = False):
+        self.attribute = attribute
+        self.json_name = json_name or pascal_case(attribute)
+        self.optional = optional
+
+    def read_source(self) -> str:
+        if self.optional:
+            return f"json_dict.get({self.json_name!r})"
+        return f"json_dict[{self.json_name!r}]"
+
+    def from_json_source(self, namespace: Dict[str, Any]) -> str:
+        return self.read_source()
+
+    def to_json_source(self, namespace: Dict[str, Any]) -> str:
+        return f"self.{self.attribute}"
+
+
+class DateTimeField(Field):
+    def from_json_source(self, namespace: Dict[str, Any]) -> str:
+        namespace["parse_datetime"] = parse_datetime
+        return f"parse_datetime({self.read_source()})"
+
+    def to_json_source(self, namespace: Dict[str, Any]) -> str:
+        namespace["datetime_to_string"] = Utils.datetime_to_string
+        return f"datetime_to_string(self.{self.attribute})"
+
+
+class EntityField(Field):
+    """Nested entity, by class name, resolved in the module of the declaring class. None stays None."""
+
+    def __init__(
+        self, attribute: str, entity_type: str, json_name: Optional[str] = None, optional: bool = False
+    ):
+        super().__init__(attribute, json_name, optional)
+        self.entity_type = entity_type
+
+    def _entity_from_json(self, namespace: Dict[str, Any]) -> str:
+        # Looked up on the class at call time, the nested class may not have compiled its own from_json yet
+        namespace[self.entity_type] = resolve_entity_type(namespace["cls"], self.entity_type)
+        return f"{self.entity_type}.from_json"
+
+    def from_json_source(self, namespace: Dict[str, Any]) -> str:
+        return f"(None if (value := {self.read_source()}) is None else {self._entity_from_json(namespace)}(value))"
+
+    def to_json_source(self, namespace: Dict[str, Any]) -> str:
+        return f"(None if (value := self.{self.attribute}) is None else value.to_json())"
+
+
+class EntityListField(EntityField):
+    def from_json_source(self, namespace: Dict[str, Any]) -> str:
+        from_json = self._entity_from_json(namespace)
+        return f"(None if (value := {self.read_source()}) is None else [{from_json}(item) for item in value])"
+
+    def to_json_source(self, namespace: Dict[str, Any]) -> str:
+        return f"(None if (value := self.{self.attribute}) is None else [item.to_json() for item in value])"
+
+
+def resolve_entity_type(cls: type, name: str) -> type:
+    return getattr(sys.modules[cls.__module__], name)
+
+
+def compile_serializers(cls: type, fields: Tuple[Field, ...]) -> Tuple[Callable, Callable]:
+    namespace: Dict[str, Any] = {"cls": cls}
+    arguments = ",\n        ".join(field.from_json_source(namespace) for field in fields)
+    items = ",\n        ".join(f"{field.json_name!r}: {field.to_json_source(namespace)}" for field in fields)
+    source = (
+        f"def from_json(cls, json_dict):\n    return cls(\n        {arguments},\n    )\n\n"
+        f"def to_json(self):\n    return {{\n        {items},\n    }}\n"
+    )
+    exec(compile(source, f"<serializers of {cls.__qualname__}>", "exec"), namespace)
+    namespace["from_json"].__qualname__ = f"{cls.__qualname__}.from_json"
+    namespace["to_json"].__qualname__ = f"{cls.__qualname__}.to_json"
+    return namespace["from_json"], namespace["to_json"]
+
+
+@lru_cache(maxsize=None)
+def slot_names(cls: type) -> Tuple[str, ...]:
+    return tuple(
+        name
+        for klass in reversed(cls.__mro__)
+        for name in klass.__dict__.get("__slots__", ())
+        if name not in ("__weakref__", "__dict__")
+    )
+
+
+class SlotsDict(MutableMapping):
+    """
+    The attributes of a slotted entity, as a dict.
+    The client reads and writes entity.__dict__ directly, e.g. to get or set the document id,
+    so this stands in for the __dict__ a slotted instance doesn't have.
+    """
+
+    __slots__ = ("_entity",)
+
+    def __init__(self, entity: Any):
+        self._entity = entity
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in slot_names(type(self._entity)):
+            raise KeyError(name)
+        try:
+            return getattr(self._entity, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        setattr(self._entity, name, value)
+
+    def __delitem__(self, name: str) -> None:
+        delattr(self._entity, name)
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in slot_names(type(self._entity)) if hasattr(self._entity, name))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class SlotsEntity:
+    """Base of slotted entities, see json_schema(slots=True)."""
+
+    # Weak references let helpers keep state about an entity outside of it, e.g. dirty_tracking.py
+    __slots__ = ("__weakref__",)
+
+    @property
+    def __dict__(self) -> SlotsDict:
+        return SlotsDict(self)
+
+
+def make_slots_dataclass(cls: type, fields: Tuple[Field, ...]) -> type:
+    # Every field becomes an optional constructor argument, in schema order, like the hand-written entities
+    cls.__annotations__ = {field.attribute: Any for field in fields}
+    for field in fields:
+        setattr(cls, field.attribute, None)
+    if "Id" not in cls.__annotations__:
+        # The session sets the document id on every stored entity, whether it is part of the JSON or not
+        cls.__annotations__["Id"] = Any
+        cls.Id = dataclass_field(default=None, init=False, repr=False)
+    # eq=False keeps identity hashing, the session tracks entities by hash
+    return dataclass(slots=True, eq=False)(cls)
+
+
+def json_schema(*fields: Field, slots: bool = False) -> Callable[[Type], Type]:
+    def decorate(cls: type) -> type:
+        if slots:
+            if not issubclass(cls, SlotsEntity):
+                raise TypeError(f"{cls.__name__} must derive from SlotsEntity to use slots=True")
+            cls = make_slots_dataclass(cls, fields)
+
+        def install() -> None:
+            from_json, to_json = compile_serializers(cls, fields)
+            # Set on the class itself, the client only uses a from_json classmethod found in the class __dict__
+            cls.from_json = classmethod(from_json)
+            cls.to_json = to_json
+
+        def from_json(cls_: type, json_dict: Dict[str, Any]) -> Any:
+            install()
+            return cls.from_json.__func__(cls_, json_dict)
+
+        def to_json(self) -> Dict[str, Any]:
+            install()
+            return cls.to_json(self)
+
+        cls.json_fields = list(fields)
+        cls.from_json = classmethod(from_json)
+        cls.to_json = to_json
+        return cls
+
+    return decorate
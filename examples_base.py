@@ -1,22 +1,24 @@
 from __future__ import annotations
+import atexit
+import os
+import shutil
+import socket
+import tempfile
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 from unittest import TestCase
 from ravendb import DocumentSession, DocumentStore, PutIndexesOperation, IndexDeploymentMode
+from ravendb.documents.bulk_insert_operation import BulkInsertOperation
 from ravendb.documents.indexes.definitions import IndexPriority, IndexDefinition
-from ravendb.infrastructure.orders import (
-    Order as RavenOrder,
-    Address as RavenAddress,
-    OrderLine as RavenOrderLine,
-    Company as RavenCompany,
-    Employee as RavenEmployee,
-    Product as RavenProduct,
-    Contact as RavenContact,
-    Category as RavenCategory,
-)
-from ravendb.tools.utils import Utils
+from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
+from ravendb.serverwide.database_record import DatabaseRecord
+from ravendb.serverwide.operations.common import DeleteDatabaseOperation, CreateDatabaseOperation
 from ravendb_embedded import EmbeddedServer, ServerOptions
 
+from entity_schema import DateTimeField, EntityField, EntityListField, Field, SlotsEntity, json_schema
+from json_backend import get_json_backend, install_json_backend, uninstall_json_backend
+
 
 class User:
     def __init__(self, Id: str = None, name: str = None, age: int = None):
@@ -39,214 +41,334 @@ class User:
         )
 
 
-class Product(RavenProduct):
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "Id": self.Id,
-            "Name": self.name,
-            "Supplier": self.supplier,
-            "Category": self.category,
-            "QuantityPerUnit": self.quantity_per_unit,
-            "PricePerUnit": self.price_per_unit,
-            "UnitsInStock": self.units_in_stock,
-            "UnitsOnOrder": self.units_on_order,
-            "Discontinued": self.discontinued,
-            "ReorderLevel": self.reorder_level,
-        }
+@json_schema(
+    Field("Id", optional=True),
+    Field("name"),
+    Field("supplier"),
+    Field("category"),
+    Field("quantity_per_unit"),
+    Field("price_per_unit"),
+    Field("units_in_stock"),
+    Field("units_on_order"),
+    Field("discontinued"),
+    Field("reorder_level"),
+    slots=True,
+)
+class Product(SlotsEntity):
+    pass
 
-    @classmethod
-    def from_json(cls, json_dict: Dict[str, Any]) -> Product:
-        return cls(
-            json_dict["Id"] if "Id" in json_dict else None,
-            json_dict["Name"],
-            json_dict["Supplier"],
-            json_dict["Category"],
-            json_dict["QuantityPerUnit"],
-            json_dict["PricePerUnit"],
-            json_dict["UnitsInStock"],
-            json_dict["UnitsOnOrder"],
-            json_dict["Discontinued"],
-            json_dict["ReorderLevel"],
-        )
 
+@json_schema(Field("name"), Field("title"), slots=True)
+class Contact(SlotsEntity):
+    pass
 
-class Contact(RavenContact):
-    def to_json(self) -> Dict[str, Any]:
-        return {"Name": self.name, "Title": self.title}
 
-    @classmethod
-    def from_json(cls, json_dict: Dict[str, Any]) -> Contact:
-        return cls(json_dict["Name"], json_dict["Title"])
+@json_schema(
+    Field("Id", optional=True),
+    Field("external_id", optional=True),
+    Field("name", optional=True),
+    EntityField("contact", "Contact", optional=True),
+    EntityField("address", "Address", optional=True),
+    Field("phone", optional=True),
+    Field("fax", optional=True),
+    slots=True,
+)
+class Company(SlotsEntity):
+    pass
 
 
-class Company(RavenCompany):
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "Id": self.Id,
-            "ExternalId": self.external_id,
-            "Name": self.name,
-            "Contact": self.contact.to_json() if self.contact else None,
-            "Address": self.address.to_json() if self.address else None,
-            "Phone": self.phone,
-            "Fax": self.fax,
-        }
+@json_schema(
+    Field("product"),
+    Field("product_name"),
+    Field("price_per_unit"),
+    Field("quantity"),
+    Field("discount"),
+    slots=True,
+)
+class OrderLine(SlotsEntity):
+    pass
+
+
+@json_schema(
+    Field("key"),
+    Field("company"),
+    Field("employee"),
+    DateTimeField("ordered_at"),
+    DateTimeField("require_at"),
+    DateTimeField("shipped_at"),
+    EntityField("ship_to", "Address"),
+    Field("ship_via"),
+    Field("freight"),
+    EntityListField("lines", "OrderLine"),
+    slots=True,
+)
+class Order(SlotsEntity):
+    pass
+
+
+@json_schema(
+    Field("line1"),
+    Field("line2"),
+    Field("city"),
+    Field("region"),
+    Field("postal_code"),
+    Field("country"),
+    slots=True,
+)
+class Address(SlotsEntity):
+    pass
+
+
+@json_schema(
+    Field("Id", optional=True),
+    Field("last_name"),
+    Field("first_name"),
+    Field("title"),
+    EntityField("address", "Address"),
+    DateTimeField("hired_at"),
+    DateTimeField("birthday"),
+    Field("home_phone"),
+    Field("extension"),
+    Field("reports_to"),
+    Field("notes"),
+    Field("territories"),
+    slots=True,
+)
+class Employee(SlotsEntity):
+    pass
 
-    @classmethod
-    def from_json(cls, json_dict: Dict[str, Any]) -> Company:
-        return cls(
-            json_dict["Id"] if "Id" in json_dict else None,
-            json_dict["ExternalId"] if "ExternalId" in json_dict else None,
-            json_dict["Name"] if "Name" in json_dict else None,
-            (
-                Contact.from_json(json_dict["Contact"])
-                if "Contact" in json_dict and json_dict["Contact"] is not None
-                else None
-            ),
-            (
-                Address.from_json(json_dict["Address"])
-                if "Address" in json_dict and json_dict["Address"] is not None
-                else None
-            ),
-            json_dict["Phone"] if "Phone" in json_dict else None,
-            json_dict["Fax"] if "Fax" in json_dict else None,
-        )
 
+@json_schema(Field("Id", optional=True), Field("name"), Field("description"), slots=True)
+class Category(SlotsEntity):
+    pass
 
-class OrderLine(RavenOrderLine):
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "Product": self.product,
-            "ProductName": self.product_name,
-            "PricePerUnit": self.price_per_unit,
-            "Quantity": self.quantity,
-            "Discount": self.discount,
-        }
 
-    @classmethod
-    def from_json(cls, json_dict: Dict[str, Any]) -> OrderLine:
-        return cls(
-            json_dict["Product"],
-            json_dict["ProductName"],
-            json_dict["PricePerUnit"],
-            json_dict["Quantity"],
-            json_dict["Discount"],
-        )
+def get_worker_id() -> Optional[str]:
+    """
+    Name of the parallel worker running this process, if any.
+    Set by run_examples.py, or by pytest-xdist when the examples run under 'pytest -n'.
+    """
+    return os.environ.get("RAVENDB_EXAMPLES_WORKER") or os.environ.get("PYTEST_XDIST_WORKER")
 
 
-class Order(RavenOrder):
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "Key": self.key,
-            "Company": self.company,
-            "Employee": self.employee,
-            "OrderedAt": Utils.datetime_to_string(self.ordered_at),
-            "RequireAt": Utils.datetime_to_string(self.require_at),
-            "ShippedAt": Utils.datetime_to_string(self.shipped_at),
-            "ShipTo": self.ship_to.to_json() if self.ship_to is not None else None,
-            "ShipVia": self.ship_via,
-            "Freight": self.freight,
-            "Lines": [line.to_json() for line in self.lines],
-        }
+def close_document_store(store: DocumentStore) -> None:
+    """store.close(), also for a store whose subscription workers weren't closed."""
+    # DocumentSubscriptions.close() iterates over the workers, and each one removes itself from them once closed
+    for worker in list(store.subscriptions._subscriptions):
+        worker.close()
+    store.close()
 
-    @classmethod
-    def from_json(cls, json_dict: Dict[str, Any]) -> Order:
-        return cls(
-            json_dict["Key"],
-            json_dict["Company"],
-            json_dict["Employee"],
-            Utils.string_to_datetime(json_dict["OrderedAt"]),
-            Utils.string_to_datetime(json_dict["RequireAt"]),
-            Utils.string_to_datetime(json_dict["ShippedAt"]),
-            Address.from_json(json_dict["ShipTo"]),
-            json_dict["ShipVia"],
-            json_dict["Freight"],
-            [OrderLine.from_json(line) for line in json_dict["Lines"]],
-        )
 
+def get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
 
-class Address(RavenAddress):
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "Line1": self.line1,
-            "Line2": self.line2,
-            "City": self.city,
-            "Region": self.region,
-            "PostalCode": self.postal_code,
-            "Country": self.country,
-        }
 
-    @classmethod
-    def from_json(cls, json: Dict[str, Any]) -> Address:
-        return cls(
-            json["Line1"],
-            json["Line2"],
-            json["City"],
-            json["Region"],
-            json["PostalCode"],
-            json["Country"],
-        )
+class ExternalServer:
+    """
+    Server started by another process, e.g. the one run_examples.py shares between its workers.
+    Mirrors the parts of EmbeddedServer that the examples use.
+    """
 
+    def __init__(self, url: str):
+        self.url = url
+
+    def get_document_store(self, database: str) -> DocumentStore:
+        store = DocumentStore(self.url, database)
+        store.initialize()
+        try:
+            store.maintenance.server.send(CreateDatabaseOperation(DatabaseRecord(database)))
+        except Exception as e:
+            # Same check as EmbeddedServer, the client doesn't raise ConcurrencyException here yet
+            if "conflict" not in e.args[0] and "already exists" not in e.args[0]:
+                raise
+        return store
+
+    def get_server_uri(self) -> str:
+        return self.url
 
-class Employee(RavenEmployee):
-    def to_json(self):
-        return {
-            "Id": self.Id,
-            "LastName": self.last_name,
-            "FirstName": self.first_name,
-            "Title": self.title,
-            "Address": self.address,
-            "HiredAt": Utils.datetime_to_string(self.hired_at),
-            "Birthday": Utils.datetime_to_string(self.birthday),
-            "HomePhone": self.home_phone,
-            "Extension": self.extension,
-            "ReportsTo": self.reports_to,
-            "Notes": self.notes,
-            "Territories": self.territories,
-        }
+
+class SharedEmbeddedServer:
+    """
+    Process-wide server shared by all the examples.
+    It is started on first use, in a fresh temporary data directory,
+    and closed (and its data directory removed) when the interpreter exits.
+
+    If RAVENDB_EXAMPLES_SERVER_URL is set, the server running at that url is used instead.
+    Otherwise, the server listens on RAVENDB_EXAMPLES_PORT (8080 by default),
+    or on a free port when running as a parallel worker.
+    """
+
+    _server: Optional[Union[EmbeddedServer, ExternalServer]] = None
+    _lock = Lock()
 
     @classmethod
-    def from_json(cls, json_dict: Dict[str, Any]):
-        return cls(
-            json_dict["Id"] if "Id" in json_dict else None,
-            json_dict["LastName"],
-            json_dict["FirstName"],
-            json_dict["Title"],
-            Address.from_json(json_dict["Address"]) if json_dict["Address"] else None,
-            Utils.string_to_datetime(json_dict["HiredAt"]),
-            Utils.string_to_datetime(json_dict["Birthday"]),
-            json_dict["HomePhone"],
-            json_dict["Extension"],
-            json_dict["ReportsTo"],
-            json_dict["Notes"],
-            json_dict["Territories"],
-        )
+    def get(cls) -> Union[EmbeddedServer, ExternalServer]:
+        with cls._lock:
+            if cls._server is None:
+                server_url = os.environ.get("RAVENDB_EXAMPLES_SERVER_URL")
+                cls._server = ExternalServer(server_url) if server_url else cls._start_embedded_server()
+            return cls._server
 
+    @staticmethod
+    def _start_embedded_server() -> EmbeddedServer:
+        port = get_free_port() if get_worker_id() else int(os.environ.get("RAVENDB_EXAMPLES_PORT", 8080))
+        data_directory = tempfile.mkdtemp(prefix="ravendb-examples-")
 
-class Category(RavenCategory):
-    def to_json(self):
-        return {
-            "Id": self.Id,
-            "Name": self.name,
-            "Description": self.description,
-        }
+        server_options = ServerOptions()
+        server_options.server_url = f"http://127.0.0.1:{port}"
+        server_options.data_directory = data_directory
+        server_options.logs_path = os.path.join(data_directory, "Logs")
+
+        server = EmbeddedServer()
+        server.start_server(server_options)
+        print(server_options.server_url)
+
+        def close():
+            try:
+                # Closing a store removes it from server.document_stores, which server.close() iterates over
+                for lazy_store in list(server.document_stores.values()):
+                    if lazy_store.created:
+                        close_document_store(lazy_store.get_value())
+                server.close()
+            finally:
+                shutil.rmtree(data_directory, ignore_errors=True)
+
+        atexit.register(close)
+        return server
+
+
+class ExampleServer:
+    """
+    Per-test view of the shared server.
+    A database that an earlier test in this process already used is dropped and recreated
+    the first time a test asks for it, so each test starts from an empty database.
+    Parallel workers sharing one server get their database names prefixed with the worker id.
+    """
+
+    _used_databases: Set[str] = set()
+
+    def __init__(self, server: Union[EmbeddedServer, ExternalServer], database_prefix: str = ""):
+        self._server = server
+        self._database_prefix = database_prefix
+        self._test_databases: Set[str] = set()
+
+    def get_database_name(self, database: str) -> str:
+        return self._database_prefix + database
+
+    def get_document_store(self, database: str) -> DocumentStore:
+        database = self.get_database_name(database)
+        store = self._server.get_document_store(database)
+        if database not in self._test_databases:
+            self._test_databases.add(database)
+            if database in self._used_databases:
+                parameters = DeleteDatabaseOperation.Parameters([database], True)
+                store.maintenance.server.send(DeleteDatabaseOperation(parameters=parameters))
+                store.maintenance.server.send(CreateDatabaseOperation(DatabaseRecord(database)))
+            self._used_databases.add(database)
+        return store
+
+    def get_server_uri(self) -> str:
+        return self._server.get_server_uri()
+
+
+class RecordingSession:
+    """
+    Stand-in for a DocumentSession that keeps what gets stored instead of sending it to the server.
+    Lets the add_* helpers build seed snapshots.
+    """
+
+    def __init__(self):
+        self.documents: List[Tuple[Optional[str], object]] = []
+
+    def store(self, entity: object, key: Optional[str] = None, change_vector: Optional[str] = None) -> None:
+        self.documents.append((key, entity))
+
+    def save_changes(self) -> None:
+        pass
+
+
+class SeedSnapshot:
+    """
+    Named dataset that is built once per process and restored into fresh databases with a single bulk insert.
+    The builder returns (document id, entity) pairs, a None id lets the bulk insert generate one.
+    Ids generated on the first restore stay set on the cached entities, so every restore produces the same ids.
+
+    Large datasets can pass cache=False, the builder then streams its documents on every restore
+    instead of keeping them all in memory.
+    """
+
+    _snapshots: Dict[str, SeedSnapshot] = {}
+
+    def __init__(
+        self, name: str, builder: Callable[[], Iterable[Tuple[Optional[str], object]]], cache: bool = True
+    ):
+        self.name = name
+        self._builder = builder
+        self._cache = cache
+        self._documents: Optional[List[Tuple[Optional[str], object]]] = None
+        SeedSnapshot._snapshots[name] = self
 
     @classmethod
-    def from_json(cls, json_dict: Dict[str, Any]):
-        return cls(
-            json_dict["Id"] if "Id" in json_dict else None,
-            json_dict["Name"],
-            json_dict["Description"],
-        )
+    def get(cls, name: str) -> SeedSnapshot:
+        if name not in cls._snapshots:
+            raise ValueError(f"Unknown seed snapshot '{name}', available: {', '.join(cls._snapshots)}")
+        return cls._snapshots[name]
+
+    @staticmethod
+    def record(*helpers: Callable[[DocumentSession], None]) -> List[Tuple[Optional[str], object]]:
+        session = RecordingSession()
+        for helper in helpers:
+            helper(session)
+        return session.documents
+
+    def documents(self) -> Iterable[Tuple[Optional[str], object]]:
+        if not self._cache:
+            return self._builder()
+        if self._documents is None:
+            self._documents = list(self._builder())
+        return self._documents
+
+    def write_to(self, bulk_insert: BulkInsertOperation) -> None:
+        for key, entity in self.documents():
+            if key is None:
+                bulk_insert.store(entity)
+            else:
+                # store_as() fills in its metadata, its shared default would give every document the first one's type
+                bulk_insert.store_as(entity, key, MetadataAsDictionary())
+
+    def restore(self, store: DocumentStore) -> None:
+        with store.bulk_insert() as bulk_insert:
+            self.write_to(bulk_insert)
 
 
 class ExampleBase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The examples show the client's own behaviour, RAVENDB_EXAMPLES_JSON=orjson opts into another backend
+        json_backend_name = os.environ.get("RAVENDB_EXAMPLES_JSON")
+        if json_backend_name:
+            install_json_backend(get_json_backend(json_backend_name))
+
+    @classmethod
+    def tearDownClass(cls):
+        if os.environ.get("RAVENDB_EXAMPLES_JSON"):
+            uninstall_json_backend()
+        super().tearDownClass()
+
     def setUp(self):
-        self.embedded_server_port = 8080
-        self.embedded_server = EmbeddedServer()
-        server_options = ServerOptions()
-        server_options.server_url = f"http://127.0.0.1:{self.embedded_server_port}"
-        self.embedded_server.start_server(server_options)
-        print(server_options.server_url)
+        worker_id = get_worker_id()
+        server = SharedEmbeddedServer.get()
+        self.embedded_server_port = int(server.get_server_uri().rsplit(":", 1)[1])
+        self.embedded_server = ExampleServer(server, f"{worker_id}-" if worker_id else "")
+
+    @staticmethod
+    def seed(store: DocumentStore, *snapshot_names: str) -> None:
+        with store.bulk_insert() as bulk_insert:
+            for snapshot_name in snapshot_names:
+                SeedSnapshot.get(snapshot_name).write_to(bulk_insert)
 
     @staticmethod
     def add_categories(session: DocumentSession):
@@ -410,3 +532,10 @@ class ExampleBase(TestCase):
             # See all available properties in syntax below
         )
         store.maintenance.send(PutIndexesOperation(index_definition))
+
+
+SeedSnapshot("categories", lambda: SeedSnapshot.record(ExampleBase.add_categories))
+SeedSnapshot("orders", lambda: SeedSnapshot.record(ExampleBase.add_orders))
+SeedSnapshot("companies", lambda: SeedSnapshot.record(ExampleBase.add_companies))
+SeedSnapshot("employees", lambda: SeedSnapshot.record(ExampleBase.add_employees))
+SeedSnapshot("products", lambda: SeedSnapshot.record(ExampleBase.add_products))
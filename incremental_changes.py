@@ -0,0 +1,97 @@
+"""
+Incremental what_changed().
+
+session.advanced.what_changed() serializes every entity the session tracks and compares it with the JSON
+it was loaded from, on every call. IncrementalChanges keeps the changes of every entity deriving from
+DirtyTracked and computes them again only once the entity was modified after that, so calling it before
+every save_changes() costs as much as the entities modified in between:
+
+    with store.open_session() as session:
+        changes = IncrementalChanges(session)  # session.advanced.what_changed() goes through it from now on
+        employee = session.load("employees/1-A", TrackedEmployee)  # class TrackedEmployee(DirtyTracked, Employee)
+        ...
+        session.advanced.what_changed()
+        changes.what_changed_for(employee)  # only looks at 'employee'
+
+enable_incremental_changes(store) gives every new session of the store one, as session.incremental_changes.
+Clean DirtyTracked entities aren't serialized at all, after an in-place change of a nested value call
+mark_dirty() on them (see dirty_tracking.py). Other entities, and entities with modified metadata,
+are still compared on every call.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from ravendb import DocumentsChanges, DocumentStore
+from ravendb.documents.session.document_info import DocumentInfo
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.document_session_operations.misc import _update_metadata_modifications
+from ravendb.documents.session.event_args import SessionCreatedEventArgs
+
+from dirty_tracking import DirtyTracked, last_modification
+
+
+class IncrementalChanges:
+    def __init__(self, session: DocumentSession):
+        self.computed = 0
+        self._session = session
+        # Document id -> (last modification, JSON compared with, changes) of DirtyTracked entities
+        self._changes: Dict[str, Tuple[int, dict, Optional[List[Any]]]] = {}
+        # Shadows the method, session.advanced.what_changed() calls it
+        session._what_changed = self.what_changed
+
+    def what_changed(self) -> Dict[str, List[Any]]:
+        """session.advanced.what_changed(), computed again only for the entities modified since the last call."""
+        changes = {}
+        for key, document_info in self._session.documents_by_id.items():
+            document_changes = self._document_changes(document_info)
+            if document_changes is not None:
+                changes[document_info.key] = document_changes
+
+        for deleted_entity in self._session.deleted_entities:
+            document_info = self._session.documents_by_entity.get(deleted_entity.entity)
+            if document_info is not None:
+                changes[document_info.key] = [self._deleted()]
+        return changes
+
+    def what_changed_for(self, entity: object) -> List[Any]:
+        """The changes of one entity, empty if it isn't tracked or wasn't changed."""
+        document_info = self._session.documents_by_entity.get(entity)
+        if document_info is None:
+            return []
+        if entity in self._session.deleted_entities:
+            return [self._deleted()]
+        return self._document_changes(document_info) or []
+
+    @staticmethod
+    def _deleted() -> DocumentsChanges:
+        return DocumentsChanges("", "", DocumentsChanges.ChangeType.DOCUMENT_DELETED)
+
+    def _document_changes(self, document_info: DocumentInfo) -> Optional[List[Any]]:
+        entity = document_info.entity
+        cacheable = isinstance(entity, DirtyTracked) and document_info.metadata_instance is None
+        if cacheable:
+            modification = last_modification(entity)
+            if not modification and not document_info.new_document:
+                return None
+            cached = self._changes.get(document_info.key.lower())
+            # Saving replaces the JSON the entity is compared with
+            if cached is not None and cached[0] == modification and cached[1] is document_info.document:
+                return cached[2]
+
+        _update_metadata_modifications(document_info.metadata_instance, document_info.metadata)
+        document = self._session.entity_to_json.convert_entity_to_json(entity, document_info)
+        changes = {}
+        self._session._entity_changed(document, document_info, changes)
+        self.computed += 1
+        document_changes = changes.get(document_info.key)
+        if cacheable:
+            self._changes[document_info.key.lower()] = (modification, document_info.document, document_changes)
+        return document_changes
+
+
+def _add_incremental_changes(event_args: SessionCreatedEventArgs) -> None:
+    event_args.session.incremental_changes = IncrementalChanges(event_args.session)
+
+
+def enable_incremental_changes(store: DocumentStore) -> None:
+    store.add_on_session_creation(_add_incremental_changes)
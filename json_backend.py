@@ -0,0 +1,122 @@
+"""
+Pluggable JSON backend for the client.
+
+The client encodes request bodies, bulk insert streams and subscription acks, and decodes
+query results and loaded documents, with the module-level 'json' of each of its modules.
+install_json_backend() points those references at a faster backend, process-wide:
+
+    install_json_backend()             # orjson if installed, the standard library otherwise
+    install_json_backend(StdlibJson())  # the standard library, through the backend interface
+    uninstall_json_backend()            # the json module itself again
+
+A backend only has to provide loads() and dumps() with the standard library signatures,
+any other attribute (JSONDecodeError, JSONEncoder, ...) is taken from the standard library.
+
+Subscription batches aren't covered: the subscription worker imports JSONDecoder from the standard
+library directly and decodes the batches it reads with its raw_decode(), only its acks use the backend.
+"""
+
+import json
+import sys
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class StdlibJson:
+    name = "stdlib"
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(json, name)
+
+    def loads(self, s, **kwargs) -> Any:
+        return json.loads(s, **kwargs)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return json.dumps(obj, **kwargs)
+
+
+class OrjsonJson(StdlibJson):
+    """
+    orjson, with the output the client gets from the standard library:
+    datetimes and dataclasses go through the 'default' method (e.g. DocumentConventions.json_default)
+    instead of orjson's own formats. Anything orjson can't handle, e.g. object_hook, indent,
+    integers over 64 bits or NaN in the input, falls back to the standard library.
+    Unlike the standard library, NaN and Infinity are written as null, which is valid JSON.
+    """
+
+    name = "orjson"
+    OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def loads(self, s, **kwargs) -> Any:
+        if kwargs:
+            return json.loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # NaN and Infinity are only accepted by the standard library, which also raises the same error otherwise
+            return json.loads(s)
+
+    def dumps(
+        self, obj, default: Optional[Callable[[Any], Any]] = None, ensure_ascii: Optional[bool] = None, **kwargs
+    ) -> str:
+        # orjson never escapes non-ASCII characters, which is what ensure_ascii=False (e.g. every request body) asks for
+        if ensure_ascii or kwargs:
+            if ensure_ascii is not None:
+                kwargs["ensure_ascii"] = ensure_ascii
+            return json.dumps(obj, default=default, **kwargs)
+        try:
+            return orjson.dumps(obj, default=default, option=self.OPTIONS).decode("utf-8")
+        except TypeError:
+            # orjson.JSONEncodeError, re-raised by the standard library if it wasn't an orjson limitation
+            return json.dumps(obj, default=default)
+
+
+def default_json_backend() -> StdlibJson:
+    return OrjsonJson() if orjson is not None else StdlibJson()
+
+
+def get_json_backend(name: Optional[str] = None) -> StdlibJson:
+    """Backend by name ('orjson' or 'stdlib'), default_json_backend() if no name is given."""
+    if not name:
+        return default_json_backend()
+    if name == StdlibJson.name:
+        return StdlibJson()
+    if name == OrjsonJson.name:
+        if orjson is None:
+            raise ValueError("The orjson JSON backend needs the orjson package")
+        return OrjsonJson()
+    raise ValueError(f"Unknown JSON backend '{name}', expected '{OrjsonJson.name}' or '{StdlibJson.name}'")
+
+
+_installed: Optional[StdlibJson] = None
+
+
+def install_json_backend(backend: Optional[StdlibJson] = None) -> StdlibJson:
+    """
+    Makes every loaded ravendb module use 'backend' (default_json_backend() if None) for JSON.
+    ravendb modules imported later keep the standard library, call this again once they are loaded.
+    """
+    global _installed
+    backend = backend or default_json_backend()
+    for module_name, module in list(sys.modules.items()):
+        if module_name.startswith("ravendb.") and isinstance(getattr(module, "json", None), (StdlibJson, type(json))):
+            module.json = backend
+    _installed = backend
+    return backend
+
+
+def installed_json_backend() -> str:
+    return _installed.name if _installed is not None else StdlibJson.name
+
+
+def uninstall_json_backend() -> None:
+    """Gives every loaded ravendb module the standard library's json module back."""
+    global _installed
+    for module_name, module in list(sys.modules.items()):
+        if module_name.startswith("ravendb.") and isinstance(getattr(module, "json", None), StdlibJson):
+            module.json = json
+    _installed = None
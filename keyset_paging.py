@@ -0,0 +1,122 @@
+"""
+Keyset (seek) pagination for index queries.
+
+skip(n).take(page_size) makes the server walk past n results for every page, and with distinct()
+projections the skipped results have to be counted as well (QueryStatistics.skipped_results).
+keyset_pages() orders the query by a sort field and the document id instead, and asks every page for
+the results after the last one of the previous page, so each page costs the same:
+
+    pages = keyset_pages(
+        session,
+        Products_ByUnitsInStock,
+        Product,
+        "units_in_stock",
+        OrderingType.LONG,
+        where=lambda query: query.where_greater_than("units_in_stock", 10),
+    )
+    for page in pages:
+        process(page.results)
+        save_for_later(page.continuation_token)  # keyset_pages(..., continuation_token=...) resumes after it
+
+The ordering type has to match the values of the sort field, e.g. OrderingType.LONG for integers,
+otherwise the order (and the pages) follow their string representation. The sort key of a result is read
+from its attribute named like the sort field, in snake case (pass sort_key for anything else), its id
+from its identity property. Results inserted or modified while paging show up in a later page if they
+sort after the current one, instead of shifting all the following pages like with skip().
+Every page is a query of the session, and counts towards max_number_of_requests_per_session.
+"""
+
+import base64
+import json
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Type, TypeVar
+
+from ravendb import AbstractIndexCreationTask
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.misc import OrderingType
+from ravendb.documents.session.query import DocumentQuery
+from ravendb.tools.utils import Utils
+
+_T = TypeVar("_T")
+
+ID_FIELD = "id()"
+
+
+class KeysetPage:
+    def __init__(self, results: List[Any], continuation_token: Optional[str]):
+        self.results = results
+        # None on the last page
+        self.continuation_token = continuation_token
+
+
+def encode_continuation_token(sort_key: Any, document_id: str) -> str:
+    position = json.dumps([sort_key, document_id], default=Utils.json_default)
+    return base64.urlsafe_b64encode(position.encode("utf-8")).decode("ascii")
+
+
+def decode_continuation_token(continuation_token: str) -> Tuple[Any, str]:
+    try:
+        sort_key, document_id = json.loads(base64.urlsafe_b64decode(continuation_token.encode("ascii")))
+    except ValueError as e:
+        raise ValueError(f"Invalid continuation token '{continuation_token}'") from e
+    return sort_key, document_id
+
+
+def keyset_pages(
+    session: DocumentSession,
+    index_type: Type[AbstractIndexCreationTask],
+    object_type: Type[_T],
+    sort_field: str,
+    ordering_type: OrderingType = OrderingType.STRING,
+    page_size: int = 128,
+    where: Optional[Callable[[DocumentQuery[_T]], DocumentQuery[_T]]] = None,
+    sort_key: Optional[Callable[[_T], Any]] = None,
+    continuation_token: Optional[str] = None,
+) -> Iterator[KeysetPage]:
+    """
+    The results of session.query_index_type(index_type, object_type), filtered by 'where',
+    ordered by 'sort_field' and the document id, one query per page of up to 'page_size' results.
+    """
+    if sort_key is None:
+        attribute = Utils.convert_to_snake_case(sort_field)
+
+        def sort_key(entity: _T) -> Any:
+            return getattr(entity, attribute)
+
+    position = decode_continuation_token(continuation_token) if continuation_token else None
+    while True:
+        query = session.query_index_type(index_type, object_type)
+        if position is None:
+            if where is not None:
+                query = where(query)
+        else:
+            last_key, last_id = position
+            # The conditions of 'where' in a subclause of their own, so an or_else() in it can't escape the position.
+            # The position implies the lower bound, which keeps the subclause from being empty
+            query = query.open_subclause().where_greater_than_or_equal(sort_field, last_key)
+            if where is not None:
+                query = where(query)
+            query = (
+                query.close_subclause()
+                .and_also()
+                .open_subclause()
+                .where_greater_than(sort_field, last_key)
+                .or_else()
+                .open_subclause()
+                .where_equals(sort_field, last_key)
+                .and_also()
+                .where_greater_than(ID_FIELD, last_id)
+                .close_subclause()
+                .close_subclause()
+            )
+
+        # One more result than a page, to know whether there's a next one without asking for it
+        results = list(query.order_by(sort_field, ordering_type).order_by(ID_FIELD).take(page_size + 1))
+        if len(results) <= page_size:
+            yield KeysetPage(results, None)
+            return
+
+        results = results[:page_size]
+        last = results[-1]
+        identity_property_name = session.conventions.get_identity_property_name(type(last))
+        position = sort_key(last), getattr(last, identity_property_name)
+        yield KeysetPage(results, encode_continuation_token(*position))
@@ -0,0 +1,252 @@
+import datetime
+from itertools import chain
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+from ravendb import DocumentStore
+from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
+
+from examples_base import Address, Category, Company, Contact, Employee, Order, OrderLine, Product
+
+# Cardinalities of the Northwind sample database, multiplied by 'scale'
+COMPANIES = 91
+EMPLOYEES = 9
+PRODUCTS = 77
+ORDERS = 830
+
+CATEGORIES = [
+    ("Beverages", "Soft drinks, coffees, teas, beers, and ales"),
+    ("Condiments", "Sweet and savory sauces, relishes, spreads, and seasonings"),
+    ("Confections", "Desserts, candies, and sweet breads"),
+    ("Dairy Products", "Cheeses"),
+    ("Grains/Cereals", "Breads, crackers, pasta, and cereal"),
+    ("Meat/Poultry", "Prepared meats"),
+    ("Produce", "Dried fruit and bean curd"),
+    ("Seafood", "Seaweed and fish"),
+]
+CITIES = [
+    ("Berlin", "Germany"),
+    ("London", "UK"),
+    ("Madrid", "Spain"),
+    ("Paris", "France"),
+    ("Seattle", "USA"),
+    ("Sao Paulo", "Brazil"),
+    ("Montreal", "Canada"),
+    ("Torino", "Italy"),
+    ("Bern", "Switzerland"),
+    ("Warszawa", "Poland"),
+]
+FIRST_NAMES = ["Nancy", "Andrew", "Janet", "Margaret", "Steven", "Michael", "Robert", "Laura", "Anne", "John"]
+LAST_NAMES = ["Davolio", "Fuller", "Leverling", "Peacock", "Buchanan", "Suyama", "King", "Callahan", "Dodsworth"]
+TITLES = ["Sales Representative", "Sales Manager", "Inside Sales Coordinator", "Vice President, Sales"]
+COMPANY_WORDS = ["Alfreds", "Around", "Blauer", "Bon", "Eastern", "Frankenversand", "Island", "Magazzini", "Wolski"]
+COMPANY_SUFFIXES = ["Futterkiste", "the Horn", "See Delikatessen", "app'", "Connection", "Trading", "Riuniti", "Zajazd"]
+PRODUCT_WORDS = ["Chai", "Chang", "Aniseed", "Tofu", "Ikura", "Konbu", "Pavlova", "Gnocchi", "Tourtiere", "Mascarpone"]
+QUANTITIES_PER_UNIT = ["10 boxes x 20 bags", "24 - 12 oz bottles", "12 - 550 ml bottles", "48 pies", "1 kg pkg."]
+DISCOUNTS = np.array([0.0, 0.05, 0.1, 0.15, 0.2, 0.25])
+DISCOUNT_WEIGHTS = np.array([0.61, 0.09, 0.08, 0.08, 0.08, 0.06])
+
+FIRST_ORDER_DATE = np.datetime64("1996-07-04")
+ORDER_DATE_SPAN_DAYS = 671
+
+
+def zipf_weights(size: int, exponent: float = 1.1) -> np.ndarray:
+    weights = 1.0 / np.arange(1, size + 1) ** exponent
+    return weights / weights.sum()
+
+
+def to_datetimes(values: np.ndarray) -> List[Optional[datetime.datetime]]:
+    # datetime64[us] converts to datetime.datetime, NaT converts to None
+    return values.astype("datetime64[us]").tolist()
+
+
+class NorthwindGenerator:
+    """
+    Generates a Northwind-like dataset of any size, e.g. for load testing queries and indexes.
+    Related documents reference each other by id, with Northwind's cardinalities multiplied by 'scale'.
+    The same seed always generates the same documents.
+
+    Column values are generated with NumPy, a chunk of orders at a time,
+    so the documents can be streamed straight into a bulk insert:
+
+        NorthwindGenerator(scale=1000, seed=42).bulk_insert(store)
+
+    documents() matches the SeedSnapshot builder signature:
+
+        SeedSnapshot("northwind-x1000", NorthwindGenerator(scale=1000).documents, cache=False)
+    """
+
+    def __init__(self, scale: float = 1.0, seed: int = 0, chunk_size: int = 10_000):
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.companies_count = max(1, round(COMPANIES * scale))
+        self.employees_count = max(1, round(EMPLOYEES * scale))
+        self.products_count = max(1, round(PRODUCTS * scale))
+        self.orders_count = max(1, round(ORDERS * scale))
+
+        # Columns referenced by other collections are generated up front
+        rng = self._rng(0)
+        self._company_cities = rng.integers(0, len(CITIES), self.companies_count)
+        self._product_names = [
+            f"{PRODUCT_WORDS[word]} {number}"
+            for word, number in zip(
+                rng.integers(0, len(PRODUCT_WORDS), self.products_count).tolist(), range(1, self.products_count + 1)
+            )
+        ]
+        self._product_prices = np.round(rng.lognormal(3.0, 0.8, self.products_count), 2)
+
+    def _rng(self, stream: int) -> np.random.Generator:
+        # Independent stream per collection, so changing one collection's generation doesn't shift the others
+        return np.random.default_rng([self.seed, stream])
+
+    def categories(self) -> Iterator[Tuple[str, Category]]:
+        for number, (name, description) in enumerate(CATEGORIES, 1):
+            yield f"categories/{number}-A", Category(f"categories/{number}-A", name, description)
+
+    def companies(self) -> Iterator[Tuple[str, Company]]:
+        rng = self._rng(1)
+        words = rng.integers(0, len(COMPANY_WORDS), self.companies_count).tolist()
+        suffixes = rng.integers(0, len(COMPANY_SUFFIXES), self.companies_count).tolist()
+        contacts = rng.integers(0, len(FIRST_NAMES), self.companies_count).tolist()
+        phones = rng.integers(1_000_000, 9_999_999, self.companies_count).tolist()
+        for number, word, suffix, contact, city, phone in zip(
+            range(1, self.companies_count + 1), words, suffixes, contacts, self._company_cities.tolist(), phones
+        ):
+            key = f"companies/{number}-A"
+            yield key, Company(
+                key,
+                f"C{number:05d}",
+                f"{COMPANY_WORDS[word]} {COMPANY_SUFFIXES[suffix]}",
+                Contact(FIRST_NAMES[contact], "Owner"),
+                Address(f"{number} Main St.", None, CITIES[city][0], None, f"{number:05d}", CITIES[city][1]),
+                f"({phone // 10_000:03d}) {phone % 10_000:04d}",
+            )
+
+    def employees(self) -> Iterator[Tuple[str, Employee]]:
+        rng = self._rng(2)
+        count = self.employees_count
+        first_names = rng.integers(0, len(FIRST_NAMES), count).tolist()
+        last_names = rng.integers(0, len(LAST_NAMES), count).tolist()
+        titles = rng.choice(len(TITLES), count, p=[0.7, 0.1, 0.1, 0.1]).tolist()
+        cities = rng.integers(0, len(CITIES), count).tolist()
+        birthdays = to_datetimes(np.datetime64("1937-09-19") + rng.integers(0, 30 * 365, count))
+        hired_at = to_datetimes(np.datetime64("1992-04-01") + rng.integers(0, 3 * 365, count))
+        # Everyone reports to the first employee, as in Northwind
+        for number in range(1, count + 1):
+            index = number - 1
+            key = f"employees/{number}-A"
+            yield key, Employee(
+                key,
+                LAST_NAMES[last_names[index]],
+                FIRST_NAMES[first_names[index]],
+                TITLES[titles[index]],
+                Address(city=CITIES[cities[index]][0], country=CITIES[cities[index]][1]),
+                hired_at[index],
+                birthdays[index],
+                extension=str(1000 + number),
+                reports_to="employees/1-A" if number > 1 else None,
+                notes=[],
+                territories=[],
+            )
+
+    def products(self) -> Iterator[Tuple[str, Product]]:
+        rng = self._rng(3)
+        count = self.products_count
+        categories = rng.integers(1, len(CATEGORIES) + 1, count).tolist()
+        suppliers = rng.integers(1, max(2, count // 3), count).tolist()
+        quantities = rng.integers(0, len(QUANTITIES_PER_UNIT), count).tolist()
+        units_in_stock = rng.integers(0, 125, count).tolist()
+        units_on_order = np.where(rng.random(count) < 0.2, rng.integers(1, 100, count), 0).tolist()
+        discontinued = (rng.random(count) < 0.1).tolist()
+        reorder_levels = (rng.integers(0, 7, count) * 5).tolist()
+        prices = self._product_prices.tolist()
+        for number in range(1, count + 1):
+            index = number - 1
+            key = f"products/{number}-A"
+            yield key, Product(
+                key,
+                self._product_names[index],
+                f"suppliers/{suppliers[index]}-A",
+                f"categories/{categories[index]}-A",
+                QUANTITIES_PER_UNIT[quantities[index]],
+                prices[index],
+                units_in_stock[index],
+                units_on_order[index],
+                discontinued[index],
+                reorder_levels[index],
+            )
+
+    def orders(self) -> Iterator[Tuple[str, Order]]:
+        rng = self._rng(4)
+        # A few companies and products account for most of the orders and lines
+        company_weights = zipf_weights(self.companies_count)
+        product_weights = zipf_weights(self.products_count)
+
+        for start in range(0, self.orders_count, self.chunk_size):
+            count = min(self.chunk_size, self.orders_count - start)
+
+            # Northwind averages ~2.6 lines per order
+            lines_per_order = np.minimum(rng.poisson(1.6, count) + 1, 25)
+            lines_total = int(lines_per_order.sum())
+            line_products = rng.choice(self.products_count, lines_total, p=product_weights)
+            line_quantities = np.minimum(rng.geometric(1 / 20, lines_total), 130).tolist()
+            line_discounts = rng.choice(DISCOUNTS, lines_total, p=DISCOUNT_WEIGHTS).tolist()
+            line_prices = self._product_prices[line_products].tolist()
+            line_products = line_products.tolist()
+
+            companies = rng.choice(self.companies_count, count, p=company_weights)
+            employees = rng.integers(1, self.employees_count + 1, count).tolist()
+            ordered_at = FIRST_ORDER_DATE + rng.integers(0, ORDER_DATE_SPAN_DAYS, count).astype("timedelta64[D]")
+            require_at = ordered_at + np.timedelta64(28, "D")
+            shipped_at = ordered_at + rng.integers(1, 36, count).astype("timedelta64[D]")
+            shipped_at[rng.random(count) < 0.025] = np.datetime64("NaT")
+            ship_via = rng.integers(1, 4, count).tolist()
+            freight = np.round(rng.lognormal(3.2, 1.1, count), 2).tolist()
+            cities = self._company_cities[companies].tolist()
+            companies = companies.tolist()
+            ordered_at, require_at, shipped_at = (
+                to_datetimes(ordered_at),
+                to_datetimes(require_at),
+                to_datetimes(shipped_at),
+            )
+
+            line = 0
+            for index, lines_count in enumerate(lines_per_order.tolist()):
+                lines = [
+                    OrderLine(
+                        f"products/{line_products[i] + 1}-A",
+                        self._product_names[line_products[i]],
+                        line_prices[i],
+                        line_quantities[i],
+                        line_discounts[i],
+                    )
+                    for i in range(line, line + lines_count)
+                ]
+                line += lines_count
+
+                key = f"orders/{start + index + 1}-A"
+                city, country = CITIES[cities[index]]
+                yield key, Order(
+                    key,
+                    f"companies/{companies[index] + 1}-A",
+                    f"employees/{employees[index]}-A",
+                    ordered_at[index],
+                    require_at[index],
+                    shipped_at[index],
+                    Address(city=city, country=country),
+                    f"shippers/{ship_via[index]}-A",
+                    freight[index],
+                    lines,
+                )
+
+    def documents(self) -> Iterator[Tuple[str, object]]:
+        return chain(self.categories(), self.companies(), self.employees(), self.products(), self.orders())
+
+    def bulk_insert(self, store: DocumentStore) -> int:
+        count = 0
+        with store.bulk_insert() as bulk_insert:
+            for key, entity in self.documents():
+                # store_as() fills in its metadata, its shared default would give every document the first one's type
+                bulk_insert.store_as(entity, key, MetadataAsDictionary())
+                count += 1
+        return count
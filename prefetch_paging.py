@@ -0,0 +1,78 @@
+"""
+Paged queries with parallel page prefetching.
+
+Paging with skip() and take() in a loop waits for every page before asking for the next one, so reading
+N pages takes N round trips one after another. prefetch_pages() learns the number of pages from the
+QueryStatistics.total_results of the first one, and fetches up to 'window' of the following pages on a
+thread pool while the caller processes the current one:
+
+    def products_in_stock(session):
+        return (
+            session.query_index_type(Products_ByUnitsInStock, Product)
+            .where_greater_than("units_in_stock", 10)
+            .order_by("units_in_stock", OrderingType.LONG)
+            .no_tracking()
+        )
+
+    for page in prefetch_pages(store, products_in_stock, page_size=1_000, window=4):
+        export(page)
+
+Pages are yielded in order. make_query builds the query in a new session for every page (sessions aren't
+thread safe), so it is called from the worker threads, and the entities of a page are tracked by a session
+that is already closed: modifying them has no effect. The query needs a stable order (order_by) for its
+pages not to overlap, and like with any skip() paging, results added or removed while paging can shift them.
+"""
+
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterator, List, Optional
+
+from ravendb import DocumentStore, QueryStatistics
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.query import DocumentQuery
+
+
+def prefetch_pages(
+    store: DocumentStore,
+    make_query: Callable[[DocumentSession], DocumentQuery],
+    page_size: int = 1_024,
+    window: int = 4,
+    database: Optional[str] = None,
+) -> Iterator[List[Any]]:
+    """The results of make_query(session), page by page, with up to 'window' pages fetched ahead."""
+    if page_size < 1 or window < 1:
+        raise ValueError("page_size and window must be positive")
+
+    def fetch(page_number: int, stats_callback: Optional[Callable[[QueryStatistics], None]] = None) -> List[Any]:
+        with store.open_session(database) as session:
+            query = make_query(session)
+            if stats_callback is not None:
+                query = query.statistics(stats_callback)
+            return list(query.skip(page_number * page_size).take(page_size))
+
+    statistics: List[QueryStatistics] = []
+    first_page = fetch(0, statistics.append)
+    page_count = math.ceil(statistics[0].total_results / page_size) if statistics else 1
+    if page_count <= 1:
+        yield first_page
+        return
+
+    executor = ThreadPoolExecutor(min(window, page_count - 1), thread_name_prefix="prefetch-pages")
+    pending: Deque[Future] = deque()
+    next_page = 1
+    try:
+        while next_page < page_count and len(pending) < window:
+            pending.append(executor.submit(fetch, next_page))
+            next_page += 1
+        yield first_page
+
+        while pending:
+            page = pending.popleft().result()
+            if next_page < page_count:
+                pending.append(executor.submit(fetch, next_page))
+                next_page += 1
+            yield page
+    finally:
+        # The caller may stop iterating early, the pages not started yet aren't needed
+        executor.shutdown(wait=False, cancel_futures=True)
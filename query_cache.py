@@ -0,0 +1,190 @@
+"""
+Store-level cache of query results, shared by all sessions of a store.
+
+A dashboard running the same queries many times per second sends every one of them to the server, at best
+answered with 304 Not Modified. Aggressive caching (see aggressive_cache.py) skips the request, but each hit
+still goes through the request executor and parses the cached response again.
+QueryCache keeps the results of the queries run through it, keyed by their normalized RQL, parameters
+and result type, and hands them to the session like a response from the server:
+
+    cache = QueryCache(store, ttl=datetime.timedelta(seconds=30))  # after store.initialize()
+
+    with store.open_session() as session:
+        products = cache.query(
+            session.query_index_type(Products_ByUnitsInStock, Product).where_greater_than("units_in_stock", 10)
+        )
+    print(cache.hits, cache.misses)
+
+Results are cached for up to 'ttl', the least recently used beyond 'max_queries' are dropped. The Changes
+API drops the results of an index whenever it processed new documents (which changes its result etags)
+or was modified, and the results of collection queries when a document of the collection changed.
+Notifications arrive a few milliseconds after the change, a query in between can still get the previous
+results. Stale results and results with includes aren't cached. With use_changes=False results are only
+dropped once they're older than 'ttl'.
+"""
+
+import datetime
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ravendb import DocumentStore
+from ravendb.changes.observers import ActionObserver
+from ravendb.changes.types import DocumentChange, IndexChange
+from ravendb.documents.queries.query import QueryResult
+from ravendb.documents.session.query import AbstractDocumentQuery
+from ravendb.primitives import constants
+from ravendb.tools.utils import Utils
+
+COLLECTION_INDEX_PREFIX = "collection/"
+
+# Quoted strings, kept as is, or whitespace
+_QUERY_TEXT_TOKENS = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")|\s+""")
+
+
+def normalize_query_text(query_text: str) -> str:
+    """The query with every run of whitespace outside quoted strings collapsed into a single space."""
+    return _QUERY_TEXT_TOKENS.sub(lambda match: match.group(1) or " ", query_text).strip()
+
+
+class QueryCache:
+    def __init__(
+        self,
+        store: DocumentStore,
+        max_queries: int = 1_024,
+        ttl: datetime.timedelta = datetime.timedelta(minutes=1),
+        use_changes: bool = True,
+        database: Optional[str] = None,
+    ):
+        self.max_queries = max_queries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._store = store
+        self._database = database
+        # Key -> (index name, cached at, result)
+        self._results: OrderedDict[Tuple, Tuple[str, float, QueryResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation, results received while an index changed aren't cached
+        self._invalidations = 0
+        self._unsubscribe = []
+
+        if use_changes:
+            changes = store.changes(database)
+            for observable, on_next in (
+                (changes.for_all_indexes(), self._on_index_change),
+                (changes.for_all_documents(), self._on_document_change),
+            ):
+                self._unsubscribe.append(
+                    observable.subscribe_with_observer(ActionObserver(on_next=on_next, on_error=self._on_changes_error))
+                )
+                observable.ensure_subscribe_now()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def query(self, query: AbstractDocumentQuery) -> List[Any]:
+        """list(query), from the cache if the same query was run before."""
+        session = query._the_session
+        query_operation = query.initialize_query_operation()
+        index_query = query_operation.index_query
+        key = (
+            normalize_query_text(index_query.query),
+            json.dumps(index_query.query_parameters, sort_keys=True, default=Utils.json_default),
+            query._object_type,
+            query.is_project_into,
+        )
+
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                if time.monotonic() - cached[1] > self.ttl.total_seconds():
+                    del self._results[key]
+                    cached = None
+                else:
+                    self._results.move_to_end(key)
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            invalidations = self._invalidations
+
+        query_operation.enter_query_context()
+        if cached is None:
+            command = query_operation.create_request()
+            session.request_executor.execute_command(command, session.session_info)
+            if self._add(key, command.result, invalidations):
+                result = self._copy(command.result)
+            else:
+                result = command.result
+        else:
+            result = self._copy(cached[2])
+
+        # Raises for a missing index or stale results, like any query, and fills in query.statistics()
+        query_operation.set_result(result)
+        query.invoke_after_query_executed(result)
+        return query_operation.complete(query._object_type)
+
+    def invalidate(self, index_name: str) -> None:
+        """Drops the results of the queries of an index, or of a collection with 'collection/<name>'."""
+        with self._lock:
+            self._invalidations += 1
+            for key in [key for key, cached in self._results.items() if cached[0].lower() == index_name.lower()]:
+                del self._results[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._results.clear()
+
+    def close(self) -> None:
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe.clear()
+        self.clear()
+
+    def _add(self, key: Tuple, result: QueryResult, invalidations: int) -> bool:
+        if result is None or result.is_stale or result.includes or result.counter_includes:
+            return False
+        if result.time_series_includes or result.compare_exchange_value_includes:
+            return False
+        with self._lock:
+            if invalidations != self._invalidations:
+                return False
+            self._results[key] = (result.index_name, time.monotonic(), result)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_queries:
+                self._results.popitem(last=False)
+        return True
+
+    @staticmethod
+    def _copy(result: QueryResult) -> QueryResult:
+        # The session updates the metadata of a tracked document in place when it saves it, every query gets its
+        # own. The documents themselves are only read, converting them into entities copies them
+        result = result.create_snapshot()
+        results = []
+        for document in result.results:
+            metadata: Dict[str, Any] = document.get(constants.Documents.Metadata.KEY)
+            results.append({**document, constants.Documents.Metadata.KEY: dict(metadata)} if metadata else document)
+        result.results = results
+        return result
+
+    def _on_index_change(self, change: IndexChange) -> None:
+        self.invalidate(change.name)
+
+    def _on_document_change(self, change: DocumentChange) -> None:
+        if change.collection_name:
+            self.invalidate(COLLECTION_INDEX_PREFIX + change.collection_name)
+
+    def _on_changes_error(self, exception: Exception) -> None:
+        # Notifications may have been missed
+        self.clear()
@@ -0,0 +1,46 @@
+"""
+Streaming query results.
+
+Paging through a large result set with skip() and take() sends a query per page, and every page costs
+the server more than the previous one. session.advanced.stream() runs a query as a single streamed
+request instead, stream() wraps it for loops that only want the entities:
+
+    with store.open_session() as session:
+        stats = StreamQueryStatistics()
+        for order in stream(session.query(object_type=Order).where_equals("Company", "companies/1-A"), stats):
+            ...
+
+Only the results that were yielded but not released by the caller are in memory, however many the query
+has, and like every streamed result they aren't tracked by the session. The request is sent on the first
+next() and counts towards max_number_of_requests_per_session. The response is read while iterating, stop
+iterating or close() the generator to release the connection early. Streams don't wait for indexing, the
+client refuses queries with wait_for_non_stale_results(). Projections of a single field into a str or another
+primitive type need session.advanced.stream(), which knows the projected field.
+"""
+
+from typing import Any, Iterator, Optional
+
+from ravendb.documents.session.operations.query import QueryOperation
+from ravendb.documents.session.operations.stream import StreamOperation
+from ravendb.documents.session.query import AbstractDocumentQuery
+from ravendb.documents.session.stream_statistics import StreamQueryStatistics
+from ravendb.primitives import constants
+
+
+def stream(query: AbstractDocumentQuery, stream_query_stats: Optional[StreamQueryStatistics] = None) -> Iterator[Any]:
+    """Yields the entities of 'query', read from a single streamed response."""
+    session = query.session
+    # The same request session.advanced.stream() sends, the iterator it returns can't close the response though
+    stream_operation = StreamOperation(session, stream_query_stats)
+    command = stream_operation.create_request(query.index_query)
+    session.request_executor.execute_command(command, session.session_info)
+
+    # Closes the response on leaving, also when the caller stops iterating early
+    with stream_operation.set_result(command.result) as documents:
+        for document in documents:
+            query.invoke_after_stream_executed(document)
+            metadata = document[constants.Documents.Metadata.KEY]
+            key = metadata.get(constants.Documents.Metadata.ID)
+            yield QueryOperation.deserialize(
+                query.query_class, key, document, metadata, None, True, session, query.is_project_into
+            )
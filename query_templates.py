@@ -0,0 +1,152 @@
+"""
+Compiled query templates.
+
+Every run of session.query(...).where_equals(...) builds the query's tokens and writes its RQL again,
+although only the values change. A QueryTemplate builds the query once, with named parameters in place
+of the values, and only binds new values to its parameters on every run after that:
+
+    employees_named = QueryTemplate(
+        lambda session, p: session.query(object_type=Employee)
+        .where_equals("FirstName", p.first_name)
+        .where_in("Title", p.titles)
+    )
+
+    with store.open_session() as session:
+        employees = employees_named.run(session, first_name="Robert", titles=["Sales Representative"])
+
+The template is compiled by its first run, with that run's session, and can be shared by all the
+sessions of the store afterwards. The build function is only called once: the parameters have no value yet,
+so it can't depend on them (e.g. to add a condition only for some values). Values are sent as is,
+the query value converters of the conventions don't apply to them, and the on_before_query listeners of
+a session and the before_query_executed() and after_query_executed() callbacks of the query only run
+for the compiling run. Each run is one query of the session, and counts towards
+max_number_of_requests_per_session.
+"""
+
+import copy
+import datetime
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ravendb.documents.queries.index_query import IndexQuery
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.operations.query import QueryOperation
+from ravendb.documents.session.query import AbstractDocumentQuery
+from ravendb.tools.utils import Utils
+
+
+class QueryParameter:
+    """Stands for the value of a template parameter while the template is compiled."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __iter__(self):
+        # where_in() and friends iterate their values, the parameter then stands for the whole collection
+        yield self
+
+    def __repr__(self) -> str:
+        return f"QueryParameter({self.name!r})"
+
+
+class _Parameters:
+    def __getattr__(self, name: str) -> QueryParameter:
+        return QueryParameter(name)
+
+
+class _CompiledQuery:
+    def __init__(self, query: AbstractDocumentQuery):
+        self.index_query: IndexQuery = query.index_query
+        self.index_name = query.index_name
+        self.fields_to_fetch_token = query._fields_to_fetch_token
+        self.disable_entities_tracking = query._disable_entities_tracking
+        self.is_project_into = query.is_project_into
+        self.object_type = query._object_type
+        # Query parameter name -> template parameter name, and whether it stands for a collection
+        self.bindings: Dict[str, Tuple[str, bool]] = {}
+        for key, value in self.index_query.query_parameters.items():
+            if isinstance(value, QueryParameter):
+                self.bindings[key] = (value.name, False)
+            elif isinstance(value, list) and len(value) == 1 and isinstance(value[0], QueryParameter):
+                self.bindings[key] = (value[0].name, True)
+        self.parameter_names = {name for name, _ in self.bindings.values()}
+
+
+def _transform_value(value: Any) -> Any:
+    # Like the query builder does for the values it's given
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds() * 10000000
+    return value
+
+
+def _transform_collection(values: Any) -> List[Any]:
+    result = []
+    for value in values:
+        if Utils.check_if_collection_but_not_str(value):
+            result.extend(_transform_collection(value))
+        else:
+            result.append(_transform_value(value))
+    return result
+
+
+class QueryTemplate:
+    def __init__(self, build: Callable[[DocumentSession, Any], AbstractDocumentQuery]):
+        self._build = build
+        self._compiled: Optional[_CompiledQuery] = None
+        self._lock = threading.Lock()
+
+    @property
+    def query_text(self) -> Optional[str]:
+        """The RQL of the template, None until it's compiled."""
+        return self._compiled.index_query.query if self._compiled is not None else None
+
+    def index_query(self, session: DocumentSession, **values: Any) -> IndexQuery:
+        """The query to send for these parameter values."""
+        compiled = self._compile(session)
+        missing = compiled.parameter_names - values.keys()
+        unknown = values.keys() - compiled.parameter_names
+        if missing or unknown:
+            raise ValueError(
+                f"Expected values for the parameters {sorted(compiled.parameter_names)}, "
+                f"missing {sorted(missing)}, unknown {sorted(unknown)}"
+            )
+
+        parameters = dict(compiled.index_query.query_parameters)
+        for key, (name, is_collection) in compiled.bindings.items():
+            value = values[name]
+            if is_collection:
+                parameters[key] = _transform_collection(Utils.unpack_collection(value))
+            else:
+                parameters[key] = _transform_value(value)
+
+        index_query = copy.copy(compiled.index_query)
+        index_query.query_parameters = parameters
+        return index_query
+
+    def run(self, session: DocumentSession, **values: Any) -> List[Any]:
+        """The results of the query, with these parameter values."""
+        index_query = self.index_query(session, **values)
+        compiled = self._compiled
+        query_operation = QueryOperation(
+            session,
+            compiled.index_name,
+            index_query,
+            compiled.fields_to_fetch_token,
+            compiled.disable_entities_tracking,
+            False,
+            False,
+            compiled.is_project_into,
+        )
+        query_operation.enter_query_context()
+        command = query_operation.create_request()
+        session.request_executor.execute_command(command, session.session_info)
+        # Raises for a missing index or stale results, like any query
+        query_operation.set_result(command.result)
+        return query_operation.complete(compiled.object_type)
+
+    def _compile(self, session: DocumentSession) -> _CompiledQuery:
+        if self._compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = _CompiledQuery(self._build(session, _Parameters()))
+        return self._compiled
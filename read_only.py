@@ -0,0 +1,104 @@
+"""
+Read-only fast path for loads and queries.
+
+Even with SessionOptions(no_tracking=True) or query.no_tracking(), the client deep-copies every document
+it receives, runs the conversion events over it and keeps its metadata. Results that are only read, e.g.
+rendered into a report, need none of that:
+
+    with store.open_session() as session:
+        employee = load_read_only(session, "employees/1-A", Employee)
+        employees = load_read_only(session, ["employees/1-A", "employees/2-A"], Employee)
+        orders = query_read_only(session.query(object_type=Order).where_equals("Company", "companies/1-A"))
+
+The documents are turned into entities straight from the parsed response, with the entity class'
+from_json when it has one, and aren't tracked by the session. Without an object type every document is
+a read-only mapping view of the parsed JSON, without @metadata. Projections take the client's usual path.
+Each call is one request and counts towards max_number_of_requests_per_session, nothing is cached:
+loading the same id twice is two requests.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+
+from ravendb.documents.commands.crud import GetDocumentsCommand
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.operations.query import QueryOperation
+from ravendb.documents.session.query import AbstractDocumentQuery
+from ravendb.primitives import constants
+from ravendb.tools.utils import Utils
+
+_T = TypeVar("_T")
+
+
+def to_read_only_entity(session: DocumentSession, document: Dict[str, Any], object_type: Optional[Type[_T]]) -> Any:
+    """The entity of a document just parsed from a response, which it may keep or modify."""
+    metadata = document.pop(constants.Documents.Metadata.KEY, None)
+    if object_type is None:
+        return MappingProxyType(document)
+    if object_type is dict:
+        return document
+    if "from_json" in object_type.__dict__:
+        entity = object_type.from_json(document)
+    else:
+        entity = Utils.convert_json_dict_to_object(document, object_type)
+
+    # Like the client, only sets an identity property the entity has
+    identity_property_name = session.conventions.get_identity_property_name(object_type)
+    if metadata is not None and identity_property_name in entity.__dict__:
+        entity.__dict__[identity_property_name] = metadata.get(constants.Documents.Metadata.ID)
+    return entity
+
+
+def load_read_only(
+    session: DocumentSession, key_or_keys: Union[str, List[str]], object_type: Optional[Type[_T]] = None
+) -> Union[Optional[_T], Dict[str, Optional[_T]]]:
+    """Like session.load(), without tracking the results. Missing documents are None."""
+    if isinstance(key_or_keys, str):
+        command = GetDocumentsCommand.from_single_id(key_or_keys)
+    else:
+        command = GetDocumentsCommand.from_multiple_ids(key_or_keys)
+    session.increment_requests_count()
+    session.request_executor.execute_command(command, session.session_info)
+
+    # No result if none of them exists, otherwise the results aren't in the order of the ids
+    results = command.result.results if command.result is not None else []
+    found = {}
+    for document in results:
+        if document is not None:
+            key = document[constants.Documents.Metadata.KEY][constants.Documents.Metadata.ID]
+            found[key.lower()] = to_read_only_entity(session, document, object_type)
+
+    if isinstance(key_or_keys, str):
+        return found.get(key_or_keys.lower())
+    return {key: found.get(key.lower()) for key in key_or_keys}
+
+
+def query_read_only(query: AbstractDocumentQuery) -> List[Any]:
+    """Runs a query built with session.query(...) and friends, without tracking the results."""
+    session = query._the_session
+    query_operation = query.initialize_query_operation()
+    query_operation.enter_query_context()
+    command = query_operation.create_request()
+    session.request_executor.execute_command(command, session.session_info)
+    # Raises for a missing index or stale results, like any query, and fills in query.statistics()
+    query_operation.set_result(command.result)
+    query.invoke_after_query_executed(command.result)
+
+    return [to_read_only_result(query, document) for document in command.result.results]
+
+
+def to_read_only_result(query: AbstractDocumentQuery, document: Dict[str, Any]) -> Any:
+    """A result of 'query', just parsed from a response, as the query returns it but without tracking it."""
+    metadata = document.get(constants.Documents.Metadata.KEY, {})
+    if not metadata.get("@projection"):
+        return to_read_only_entity(query._the_session, document, query._object_type)
+    return QueryOperation.deserialize(
+        query._object_type,
+        metadata.get(constants.Documents.Metadata.ID),
+        document,
+        metadata,
+        query._fields_to_fetch_token,
+        True,
+        query._the_session,
+        query.is_project_into,
+    )
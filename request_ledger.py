@@ -0,0 +1,251 @@
+"""
+Per-session ledger of the requests a session sends to the server.
+
+A session allows max_number_of_requests_per_session round trips, once it runs out all it says is that
+the limit was reached. A RequestLedger records every round trip of a session: what it was (load, query,
+lazy, batch, ...), the line of code that made it, the bytes sent and received and how long it took.
+Exceeding the limit then lists the call sites in the error, and loading single documents from the same
+line over and over (the N+1 pattern, which session.load([...]) or includes would do in one request)
+raises an NPlusOneWarning:
+
+    with store.open_session() as session:
+        ledger = RequestLedger(session)
+        ...
+        print(ledger.summary())
+        ledger.save_chrome_trace("requests.json")  # chrome://tracing or https://ui.perfetto.dev
+
+enable_request_ledgers(store) gives every new session of the store a ledger, see request_ledger(session).
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import warnings
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import ravendb
+from ravendb import DocumentStore, RequestExecutor
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.event_args import (
+    BeforeRequestEventArgs,
+    SessionClosingEventArgs,
+    SessionCreatedEventArgs,
+    SucceedRequestEventArgs,
+)
+from ravendb.documents.session.misc import SessionInfo
+from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
+
+# Frames of these directories aren't call sites
+_SKIPPED_DIRECTORIES = (os.path.dirname(ravendb.__file__), os.path.dirname(threading.__file__))
+
+_REQUEST_KINDS = {
+    "GetDocumentsCommand": "load",
+    "ConditionalGetDocumentsCommand": "load",
+    "QueryCommand": "query",
+    "QueryStreamCommand": "stream",
+    "MultiGetCommand": "lazy",
+    "SingleNodeBatchCommand": "batch",
+    "ClusterWideBatchCommand": "batch",
+}
+
+
+class NPlusOneWarning(UserWarning):
+    pass
+
+
+class RequestEntry:
+    def __init__(self, kind: str, command: str, call_site: str, started: float):
+        self.kind = kind
+        self.command = command
+        self.call_site = call_site
+        self.started = started
+        self.duration_ms: Optional[float] = None
+        self.request_bytes = 0
+        self.response_bytes: Optional[int] = None
+        self.status_code: Optional[int] = None
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "Kind": self.kind,
+            "Command": self.command,
+            "CallSite": self.call_site,
+            "DurationMs": self.duration_ms,
+            "RequestBytes": self.request_bytes,
+            "ResponseBytes": self.response_bytes,
+            "StatusCode": self.status_code,
+        }
+
+
+class RequestLedger:
+    def __init__(self, session: DocumentSession, n_plus_one_threshold: int = 5):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.entries: List[RequestEntry] = []
+        self._single_loads: Counter = Counter()
+        self._created = time.perf_counter()
+
+        _LedgerRequestExecutor.install(session.request_executor).ledgers[session.session_info] = self
+        session.add_session_closing(_remove_ledger)
+
+        increment_requests_count = session.increment_requests_count
+
+        def increment_requests_count_with_call_sites() -> None:
+            try:
+                increment_requests_count()
+            except ValueError as e:
+                raise ValueError(f"{e}\n\nRequests made by this session:\n{self.summary()}") from e
+
+        session.increment_requests_count = increment_requests_count_with_call_sites
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, command: RavenCommand, started: float) -> RequestEntry:
+        filename, line_number, function = _call_site()
+        call_site = f"{os.path.relpath(filename)}:{line_number} in {function}"
+        command_name = type(command).__name__
+        entry = RequestEntry(_REQUEST_KINDS.get(command_name, "other"), command_name, call_site, started)
+        self.entries.append(entry)
+
+        if entry.kind == "load" and _loaded_ids(command) == 1:
+            self._single_loads[call_site] += 1
+            if self._single_loads[call_site] == self.n_plus_one_threshold:
+                warnings.warn_explicit(
+                    f"{self.n_plus_one_threshold} single document loads from this line in one session, "
+                    "load the documents at once with session.load([...]) or include them",
+                    NPlusOneWarning,
+                    filename,
+                    line_number,
+                )
+        return entry
+
+    def summary(self) -> str:
+        """Requests per call site and kind, most first."""
+        by_call_site = Counter((entry.call_site, entry.kind) for entry in self.entries)
+        lines = [f"{len(self.entries)} requests, {sum(e.duration_ms or 0 for e in self.entries):.1f} ms"]
+        lines.extend(f"{count:>5} {kind:<6} {call_site}" for (call_site, kind), count in by_call_site.most_common())
+        return "\n".join(lines)
+
+    def to_json(self) -> List[Dict[str, Any]]:
+        return [entry.to_json() for entry in self.entries]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """The requests as Trace Event Format 'complete' events, in microseconds since the ledger was created."""
+        return {
+            "traceEvents": [
+                {
+                    "name": f"{entry.kind} {entry.command}",
+                    "cat": entry.kind,
+                    "ph": "X",
+                    "ts": (entry.started - self._created) * 1e6,
+                    "dur": (entry.duration_ms or 0) * 1e3,
+                    "pid": os.getpid(),
+                    "tid": 0,
+                    "args": entry.to_json(),
+                }
+                for entry in self.entries
+            ]
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(self.to_json(), file, indent=2)
+
+    def save_chrome_trace(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+
+class _LedgerRequestExecutor:
+    """Records the commands sessions with a ledger send through one request executor."""
+
+    def __init__(self, request_executor: RequestExecutor):
+        self.ledgers: "WeakKeyDictionary[SessionInfo, RequestLedger]" = WeakKeyDictionary()
+        self._local = threading.local()
+        self._execute_command = request_executor.execute_command
+        # Shadows the method, sessions call request_executor.execute_command() for every round trip
+        request_executor.execute_command = self.execute_command
+        request_executor.add_on_before_request(self._on_before_request)
+        request_executor.add_on_succeed_request(self._on_succeed_request)
+
+    _install_lock = threading.Lock()
+
+    @classmethod
+    def install(cls, request_executor: RequestExecutor) -> "_LedgerRequestExecutor":
+        with cls._install_lock:
+            installed = getattr(request_executor.execute_command, "__self__", None)
+            if not isinstance(installed, cls):
+                installed = cls(request_executor)
+        return installed
+
+    def execute_command(self, command: RavenCommand, session_info: Optional[SessionInfo] = None) -> None:
+        ledger = self.ledgers.get(session_info) if session_info is not None else None
+        if ledger is None:
+            return self._execute_command(command, session_info)
+
+        started = time.perf_counter()
+        entry = ledger.record(command, started)
+        self._local.entry = entry
+        self._local.streamed = command.response_type != RavenCommandResponseType.OBJECT
+        try:
+            return self._execute_command(command, session_info)
+        finally:
+            self._local.entry = None
+            entry.duration_ms = (time.perf_counter() - started) * 1e3
+            entry.status_code = command.status_code
+
+    def _on_before_request(self, event_args: BeforeRequestEventArgs) -> None:
+        entry = getattr(self._local, "entry", None)
+        if entry is not None and isinstance(event_args.request.data, (bytes, str)):
+            entry.request_bytes += len(event_args.request.data)
+
+    def _on_succeed_request(self, event_args: SucceedRequestEventArgs) -> None:
+        entry = getattr(self._local, "entry", None)
+        if entry is None:
+            return
+        content_length = event_args.response.headers.get("Content-Length")
+        if content_length is None and not self._local.streamed:
+            # Chunked, the command reads the whole response anyway (streamed ones are read as they are processed)
+            content_length = len(event_args.response.content)
+        if content_length is not None:
+            entry.response_bytes = (entry.response_bytes or 0) + int(content_length)
+
+
+def _loaded_ids(command: RavenCommand) -> int:
+    if getattr(command, "_key", None) is not None:
+        return 1
+    return len(getattr(command, "_keys", None) or ())
+
+
+def _call_site() -> Tuple[str, int, str]:
+    frame = sys._getframe(2)
+    while frame is not None and (
+        frame.f_code.co_filename == __file__ or frame.f_code.co_filename.startswith(_SKIPPED_DIRECTORIES)
+    ):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>", 0, "<unknown>"
+    return frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+
+
+def _remove_ledger(event_args: SessionClosingEventArgs) -> None:
+    session = event_args.session
+    _LedgerRequestExecutor.install(session.request_executor).ledgers.pop(session.session_info, None)
+
+
+_session_ledgers: "WeakKeyDictionary[DocumentSession, RequestLedger]" = WeakKeyDictionary()
+
+
+def request_ledger(session: DocumentSession) -> Optional[RequestLedger]:
+    """The ledger enable_request_ledgers() gave the session."""
+    return _session_ledgers.get(session)
+
+
+def enable_request_ledgers(store: DocumentStore, n_plus_one_threshold: int = 5) -> None:
+    def add_ledger(event_args: SessionCreatedEventArgs) -> None:
+        _session_ledgers[event_args.session] = RequestLedger(event_args.session, n_plus_one_threshold)
+
+    store.add_on_session_creation(add_ledger)
@@ -0,0 +1,92 @@
+"""
+Runs the benchmarks in Benchmarks/ against the embedded server.
+
+    python run_benchmarks.py [--sizes N ...] [--iterations N] [--output results.json]
+                             [--baseline baseline.json] [--threshold 0.1] [paths...]
+
+Benchmarks/ mirrors the example directories, every module holds BenchmarkBase subclasses.
+Every bench_* method runs at every size, its ops/sec, p50/p99 latency and peak RSS are printed
+and saved as JSON. To catch regressions after a client upgrade, save a run as the baseline
+and compare later runs with it, the exit code is 1 if anything regressed beyond the threshold:
+
+    python run_benchmarks.py --output baseline.json
+    python run_benchmarks.py --baseline baseline.json
+"""
+
+import argparse
+import importlib
+import inspect
+import sys
+from typing import List, Optional, Type
+
+from benchmarks_base import (
+    BenchmarkBase,
+    BenchmarkResult,
+    compare_with_baseline,
+    get_benchmark_server,
+    load_results,
+    save_results,
+)
+from json_backend import get_json_backend, install_json_backend
+from run_examples import find_example_modules
+
+
+def find_benchmarks(modules: List[str]) -> List[Type[BenchmarkBase]]:
+    benchmarks = []
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        benchmarks.extend(
+            member
+            for _, member in inspect.getmembers(module, inspect.isclass)
+            if issubclass(member, BenchmarkBase) and member is not BenchmarkBase and member.__module__ == module_name
+        )
+    return benchmarks
+
+
+def run_benchmarks(
+    benchmarks: List[Type[BenchmarkBase]], sizes: Optional[List[int]] = None, iterations: Optional[int] = None
+) -> List[BenchmarkResult]:
+    results = []
+    print(f"{'benchmark':<90} {'size':>7} {'ops/sec':>12} {'p50 ms':>9} {'p99 ms':>9} {'RSS MB':>8}")
+    for benchmark in benchmarks:
+        for method_name in benchmark.benchmark_methods():
+            for size in sizes or benchmark.sizes:
+                # A new server wrapper for every run, so reused database names start out empty
+                result = benchmark(get_benchmark_server()).run_benchmark(method_name, size, iterations)
+                print(
+                    f"{result.name:<90} {size:>7} {result.ops_per_sec:>12.1f} "
+                    f"{result.p50_ms:>9.2f} {result.p99_ms:>9.2f} {result.peak_rss_mb:>8.1f}",
+                    flush=True,
+                )
+                results.append(result)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", default=["Benchmarks"])
+    parser.add_argument("--sizes", type=int, nargs="+", help="data sizes, overrides each benchmark's own")
+    parser.add_argument("--iterations", type=int, help="timed calls per benchmark, overrides each benchmark's own")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed regression, 0.1 = 10%%")
+    parser.add_argument("--json", choices=["orjson", "stdlib"], help="client JSON backend, orjson if installed by default")
+    args = parser.parse_args()
+
+    benchmarks = find_benchmarks(find_example_modules(args.paths))
+    # After importing the benchmarks, so the client modules they import use it too
+    install_json_backend(get_json_backend(args.json))
+    results = run_benchmarks(benchmarks, args.sizes, args.iterations)
+    save_results(results, args.output)
+    print(f"Results saved to {args.output}")
+
+    if not args.baseline:
+        return 0
+    regressions = compare_with_baseline(results, load_results(args.baseline), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Runs the examples in parallel worker processes.
+
+    python run_examples.py [--workers N] [--server-per-worker] [paths...]
+
+By default a single embedded server is started here and shared by every worker,
+each worker namespaces its databases with its own id (e.g. 'w0-Lazy'),
+so examples using the same database name don't collide.
+With --server-per-worker each worker starts its own embedded server on a free port instead.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import traceback
+import unittest
+from typing import List
+
+from examples_base import SharedEmbeddedServer
+
+EXAMPLE_DIRECTORIES = ["ClientAPI", "DocumentExtensions", "Indexes", "Server", "Tests"]
+
+
+def find_example_modules(paths: List[str]) -> List[str]:
+    modules = []
+    for path in paths:
+        if path.endswith(".py"):
+            files = [path]
+        else:
+            files = [
+                os.path.join(directory, file_name)
+                for directory, _, file_names in os.walk(path)
+                for file_name in file_names
+                if file_name.endswith(".py")
+            ]
+        modules.extend(os.path.splitext(os.path.normpath(file))[0].replace(os.sep, ".") for file in files)
+    return sorted(modules)
+
+
+def run_modules(modules: List[str]) -> int:
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    import_errors = 0
+    for module in modules:
+        try:
+            suite.addTest(loader.loadTestsFromName(module))
+        except Exception:
+            import_errors += 1
+            print(f"ERROR: cannot import {module}", file=sys.stderr)
+            traceback.print_exc()
+
+    result = unittest.TextTestRunner(verbosity=1).run(suite)
+    return 0 if result.wasSuccessful() and not import_errors else 1
+
+
+def run_workers(modules: List[str], workers: int, server_url: str = None) -> int:
+    processes = []
+    for index in range(workers):
+        worker_modules = modules[index::workers]
+        if not worker_modules:
+            continue
+        env = dict(os.environ, RAVENDB_EXAMPLES_WORKER=f"w{index}")
+        if server_url:
+            env["RAVENDB_EXAMPLES_SERVER_URL"] = server_url
+        processes.append(
+            subprocess.Popen(
+                [sys.executable, __file__, "--modules", *worker_modules],
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+        )
+
+    exit_code = 0
+    for index, process in enumerate(processes):
+        output, _ = process.communicate()
+        print(f"===== worker w{index} =====")
+        print(output)
+        exit_code = exit_code or process.returncode
+    return exit_code
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", default=EXAMPLE_DIRECTORIES)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--server-per-worker", action="store_true")
+    parser.add_argument("--modules", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.modules:
+        return run_modules(args.modules)
+
+    modules = find_example_modules(args.paths)
+    server_url = None if args.server_per_worker else SharedEmbeddedServer.get().get_server_uri()
+    return run_workers(modules, args.workers, server_url)
+
+
+if __name__ == "__main__":
+    sys.exit(main())